@@ -158,6 +158,14 @@ install_python_deps() {
     # Install required packages (including pyusb that was missing!)
     pip install PyQt6 pyusb requests beautifulsoup4 lxml
     
+    # Optional accelerators (udev hotplug events, io_uring reads, BLAKE3, fast JSON);
+    # the tool falls back to the pure Python paths when any of them is missing
+    if pip install pyudev liburing blake3 orjson; then
+        print_success "Optional accelerators installed"
+    else
+        print_warning "Some optional accelerators could not be installed, using fallbacks"
+    fi
+    
     print_success "Python dependencies installed in virtual environment"
 }
 
@@ -228,10 +236,21 @@ install_zodin() {
     # Copy ALL application files (this was the main problem!)
     print_info "Copying application files..."
     cp zodin_flash_tool.py "$APP_DIR/"
+    cp zodin_gui.py "$APP_DIR/"
     cp samsung_protocol.py "$APP_DIR/"
     cp updater.py "$APP_DIR/"
     cp flash_engines.py "$APP_DIR/"
     cp requirements.txt "$APP_DIR/"
+    cp setup.py "$APP_DIR/"
+    
+    # Optional Cython build of the interface (zodin_gui.py; the .so is picked up
+    # automatically on import and the .py file remains the fallback)
+    print_info "Compiling interface with Cython (optional)..."
+    if (cd "$APP_DIR" && pip install cython >/dev/null 2>&1 && python3 setup.py build_ext --inplace >/dev/null 2>&1); then
+        print_success "Cython module compiled"
+    else
+        print_warning "Cython build skipped, using the pure Python module"
+    fi
     
     # Copy tools directory if it exists
     if [ -d "tools" ]; then
@@ -299,7 +318,7 @@ EOF
 EOF
     
     print_success "Zodin Flash Tool installed successfully!"
-    print_info "All modules copied: zodin_flash_tool.py, samsung_protocol.py, updater.py, flash_engines.py"
+    print_info "All modules copied: zodin_flash_tool.py, zodin_gui.py, samsung_protocol.py, updater.py, flash_engines.py"
 }
 
 # Add to PATH
@@ -8,8 +8,11 @@ import usb.core
 import usb.util
 import struct
 import time
+import sys
 import hashlib
+import ssl
 import os
+import mmap
 import tarfile
 import tempfile
 import subprocess
@@ -18,6 +21,54 @@ from dataclasses import dataclass
 from enum import Enum
 import threading
 
+# io_uring é opcional: sobrepõe leitura e hash de firmwares grandes
+try:
+    import liburing
+    URING_AVAILABLE = True
+except ImportError:
+    URING_AVAILABLE = False
+
+# BLAKE3 é opcional: hash paralelo com SIMD para checksums internos (b3sum)
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Algoritmo usado nos checksums internos (não definidos pelo formato Samsung)
+INTERNAL_HASH_ALGORITHM = 'blake3' if BLAKE3_AVAILABLE else 'blake2b'
+
+# Arquivos de checksum aceitos ao lado do firmware, no formato de md5sum/sha256sum/b3sum/b2sum
+# (SHA-256 usa as instruções SHA-NI da CPU através do OpenSSL, quando disponíveis)
+CHECKSUM_SIDECARS = (('.md5', 'md5'), ('.sha256', 'sha256'), ('.blake3', 'blake3'),
+                     ('.b2', 'blake2b'))
+
+
+# Tamanho do bloco de leitura usado no cálculo de hashes de firmware (4 MiB)
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Tamanho dos blocos enviados ao dispositivo durante o flash (1 MiB)
+FLASH_CHUNK_SIZE = 1024 * 1024
+
+# Tamanho máximo lido do final de um .tar.md5 para encontrar o MD5 embutido
+TAR_MD5_TRAILER_MAX = 1024
+
+
+def hash_backend_info() -> str:
+    """Descreve o backend de hash em uso (OpenSSL e suporte a SHA-NI da CPU)"""
+    sha_ni = False
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith('flags'):
+                    sha_ni = 'sha_ni' in line.split()
+                    break
+    except OSError:
+        pass
+    
+    return (f"{hashlib.md5().name}/{hashlib.sha256().name} via {ssl.OPENSSL_VERSION} "
+            f"(SHA-NI: {'sim' if sha_ni else 'não'}), checksum interno: {INTERNAL_HASH_ALGORITHM}")
+
 
 class SamsungMode(Enum):
     """Modos do dispositivo Samsung"""
@@ -331,8 +382,19 @@ class SamsungProtocol:
             return None
     
     def flash_partition(self, partition_name: str, data: bytes, 
-                       progress_callback: Optional[Callable] = None) -> bool:
-        """Faz flash de uma partição"""
+                       progress_callback: Optional[Callable] = None,
+                       hasher=None) -> bool:
+        """Faz flash de uma partição (hasher, se informado, recebe cada bloco enviado)"""
+        total_bytes = len(data)
+        chunks = (data[offset:offset + FLASH_CHUNK_SIZE]
+                  for offset in range(0, total_bytes, FLASH_CHUNK_SIZE))
+        return self.flash_partition_stream(partition_name, chunks, total_bytes,
+                                           progress_callback, hasher)
+    
+    def flash_partition_stream(self, partition_name: str, chunks, total_bytes: int,
+                               progress_callback: Optional[Callable] = None,
+                               hasher=None) -> bool:
+        """Faz flash de uma partição a partir de blocos lidos sob demanda"""
         try:
             if not self.session_active:
                 if not self.handshake():
@@ -341,7 +403,6 @@ class SamsungProtocol:
             self.log(f"Iniciando flash da partição {partition_name}...")
             
             # Define total de bytes
-            total_bytes = len(data)
             if not self.send_packet(PacketType.FLASH_SET_TOTAL_BYTES, 
                                   struct.pack('<I', total_bytes)):
                 return False
@@ -353,12 +414,12 @@ class SamsungProtocol:
                 return False
             
             # Envia dados em chunks
-            chunk_size = 1024 * 1024  # 1MB chunks
             bytes_sent = 0
             
-            while bytes_sent < total_bytes:
-                chunk_end = min(bytes_sent + chunk_size, total_bytes)
-                chunk = data[bytes_sent:chunk_end]
+            for chunk in chunks:
+                # Verificação de integridade na mesma passada do envio
+                if hasher is not None:
+                    hasher.update(chunk)
                 
                 # Envia chunk
                 if not self.send_packet(PacketType.FLASH_SEND_DATA, chunk):
@@ -429,38 +490,70 @@ class SamsungProtocol:
 class FirmwareParser:
     """Parser para arquivos de firmware Samsung"""
     
+    @staticmethod
+    def partition_for_member(member_name: str) -> str:
+        """Determina o tipo de partição a partir do nome do arquivo dentro do TAR"""
+        filename = member_name.lower()
+        
+        if 'boot' in filename:
+            return 'BOOT'
+        elif 'recovery' in filename:
+            return 'RECOVERY'
+        elif 'system' in filename:
+            return 'SYSTEM'
+        elif 'userdata' in filename:
+            return 'USERDATA'
+        elif 'cache' in filename:
+            return 'CACHE'
+        elif 'modem' in filename or 'cp' in filename:
+            return 'MODEM'
+        elif 'sboot' in filename or 'bl' in filename:
+            return 'BOOTLOADER'
+        
+        # Usa nome do arquivo como chave
+        return os.path.splitext(member_name)[0].upper()
+    
+    @staticmethod
+    def iter_tar_members(tar_path: str):
+        """Percorre as entradas do TAR lendo só os cabeçalhos; gera (partição, membro)"""
+        with tarfile.open(tar_path, 'r:') as tar:
+            for member in tar:
+                if member.isfile():
+                    yield FirmwareParser.partition_for_member(member.name), member
+    
+    @staticmethod
+    def iter_tar_firmware(tar_path: str, chunk_size: int = FLASH_CHUNK_SIZE):
+        """Percorre as partições do TAR sem carregá-las; gera (partição, tamanho, blocos)
+        
+        Os blocos vêm de um mmap do pacote e cada gerador só é válido até a
+        próxima entrada ser pedida.
+        """
+        with open(tar_path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+            except ValueError:
+                raise Exception("Arquivo TAR vazio")
+            
+            try:
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                
+                for partition_name, member in FirmwareParser.iter_tar_members(tar_path):
+                    start, end = member.offset_data, member.offset_data + member.size
+                    chunks = (mapped[offset:min(offset + chunk_size, end)]
+                              for offset in range(start, end, chunk_size))
+                    yield partition_name, member.size, chunks
+            finally:
+                mapped.close()
+    
     @staticmethod
     def parse_tar_firmware(tar_path: str) -> Dict[str, bytes]:
         """Extrai e organiza arquivos de firmware de um TAR"""
         firmware_data = {}
         
         try:
-            with tarfile.open(tar_path, 'r') as tar:
-                for member in tar.getmembers():
-                    if member.isfile():
-                        file_data = tar.extractfile(member).read()
-                        
-                        # Determina tipo de partição baseado no nome do arquivo
-                        filename = member.name.lower()
-                        
-                        if 'boot' in filename:
-                            firmware_data['BOOT'] = file_data
-                        elif 'recovery' in filename:
-                            firmware_data['RECOVERY'] = file_data
-                        elif 'system' in filename:
-                            firmware_data['SYSTEM'] = file_data
-                        elif 'userdata' in filename:
-                            firmware_data['USERDATA'] = file_data
-                        elif 'cache' in filename:
-                            firmware_data['CACHE'] = file_data
-                        elif 'modem' in filename or 'cp' in filename:
-                            firmware_data['MODEM'] = file_data
-                        elif 'sboot' in filename or 'bl' in filename:
-                            firmware_data['BOOTLOADER'] = file_data
-                        else:
-                            # Usa nome do arquivo como chave
-                            partition_name = os.path.splitext(member.name)[0].upper()
-                            firmware_data[partition_name] = file_data
+            for partition_name, _, chunks in FirmwareParser.iter_tar_firmware(tar_path):
+                firmware_data[partition_name] = b''.join(chunks)
         
         except Exception as e:
             raise Exception(f"Erro ao analisar firmware TAR: {str(e)}")
@@ -468,25 +561,310 @@ class FirmwareParser:
         return firmware_data
     
     @staticmethod
-    def verify_firmware_integrity(file_path: str) -> bool:
-        """Verifica integridade do firmware"""
+    def _open_sequential(file_path: str) -> int:
+        """Abre o arquivo para leitura única e sequencial"""
+        fd = os.open(file_path, os.O_RDONLY)
+        
+        if hasattr(os, 'posix_fadvise'):
+            # Readahead agressivo e pré-carga da primeira janela de leitura
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, HASH_CHUNK_SIZE * 4, os.POSIX_FADV_WILLNEED)
+        
+        return fd
+    
+    @staticmethod
+    def _close_sequential(fd: int):
+        """Fecha o arquivo liberando do page cache as páginas já lidas"""
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _iter_file_uring(file_path: str, chunk_size: int = HASH_CHUNK_SIZE):
+        """Lê o arquivo via io_uring, lendo o próximo bloco enquanto o atual é processado
+        
+        Cada bloco é uma memoryview válida apenas até o próximo ser pedido.
+        """
+        ring = liburing.Ring()
+        cqe = liburing.Cqe()
+        buffers = [bytearray(chunk_size), bytearray(chunk_size)]
+        views = [memoryview(buffer) for buffer in buffers]
+        pending = False
+        
+        liburing.io_uring_queue_init(8, ring)
         try:
-            # Verifica se existe arquivo MD5
-            md5_file = file_path + '.md5'
-            if os.path.exists(md5_file):
-                with open(md5_file, 'r') as f:
-                    expected_md5 = f.read().strip().split()[0]
+            fd = FirmwareParser._open_sequential(file_path)
+            try:
+                def submit_read(index: int, offset: int):
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_read(sqe, fd, buffers[index], offset)
+                    liburing.io_uring_submit(ring)
                 
-                # Calcula MD5 do arquivo
-                hasher = hashlib.md5()
-                with open(file_path, 'rb') as f:
-                    for chunk in iter(lambda: f.read(4096), b""):
-                        hasher.update(chunk)
+                offset = 0
+                current = 0
+                submit_read(current, offset)
+                pending = True
                 
-                calculated_md5 = hasher.hexdigest()
-                return calculated_md5.lower() == expected_md5.lower()
+                while True:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    result = cqe[0].res
+                    liburing.io_uring_cq_advance(ring, 1)
+                    pending = False
+                    bytes_read = liburing.trap_error(result)
+                    if bytes_read == 0:
+                        break
+                    
+                    # Dispara a próxima leitura antes de entregar o bloco atual
+                    offset += bytes_read
+                    submit_read(1 - current, offset)
+                    pending = True
+                    yield views[current][:bytes_read]
+                    current = 1 - current
+            finally:
+                # O kernel ainda pode escrever no buffer de uma leitura em andamento
+                if pending:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    liburing.io_uring_cq_advance(ring, 1)
+                FirmwareParser._close_sequential(fd)
+        finally:
+            liburing.io_uring_queue_exit(ring)
+    
+    @staticmethod
+    def _hash_file_uring(file_path: str, hasher) -> None:
+        """Calcula o hash lendo o arquivo via io_uring"""
+        for chunk in FirmwareParser._iter_file_uring(file_path):
+            hasher.update(chunk)
+    
+    @staticmethod
+    def iter_file_chunks(file_path: str, chunk_size: int = HASH_CHUNK_SIZE):
+        """Lê o arquivo em blocos sequenciais, via io_uring quando disponível
+        
+        Cada bloco é uma memoryview válida apenas até o próximo ser pedido.
+        """
+        if URING_AVAILABLE:
+            chunks = FirmwareParser._iter_file_uring(file_path, chunk_size)
+            try:
+                first = next(chunks)
+            except StopIteration:
+                return
+            except (OSError, AttributeError, TypeError):
+                # Kernel sem io_uring ou versão incompatível do liburing
+                chunks = None
+            
+            if chunks is not None:
+                yield first
+                yield from chunks
+                return
+        
+        fd = FirmwareParser._open_sequential(file_path)
+        try:
+            buffer = bytearray(chunk_size)
+            view = memoryview(buffer)
+            while True:
+                bytes_read = os.readv(fd, [buffer])
+                if not bytes_read:
+                    break
+                yield view[:bytes_read]
+        finally:
+            FirmwareParser._close_sequential(fd)
+    
+    @staticmethod
+    def _hash_file_mmap(file_path: str, hasher, length: int = 0) -> bool:
+        """Calcula o hash direto do page cache via mmap, sem cópias para o usuário
+        
+        Com length > 0 apenas os primeiros length bytes são mapeados. Retorna False
+        quando o arquivo não pode ser mapeado (vazio, não regular ou grande demais
+        para o espaço de endereçamento de um processo 32 bits).
+        """
+        with open(file_path, 'rb') as f:
+            size = length or os.fstat(f.fileno()).st_size
+            if size == 0 or (sys.maxsize <= 2**32 and size >= 2**31):
+                return False
+            
+            try:
+                mapped = mmap.mmap(f.fileno(), length, prot=mmap.PROT_READ)
+            except (OSError, ValueError):
+                return False
             
-            # Se não há arquivo MD5, assume que está correto
+            try:
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hasher.update(mapped)
+            finally:
+                mapped.close()
+        
+        return True
+    
+    @staticmethod
+    def hash_file(file_path: str, algorithm: str = 'md5') -> str:
+        """Calcula o hash de um arquivo pelo caminho mais rápido disponível
+        
+        Usa mmap sempre que possível; caso contrário lê em blocos via io_uring
+        ou com uma thread leitora.
+        """
+        if algorithm == 'blake3':
+            # BLAKE3 lê o arquivo via mmap e distribui o hash entre threads
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return hasher.hexdigest()
+        
+        hasher = hashlib.new(algorithm)
+        if FirmwareParser._hash_file_mmap(file_path, hasher):
+            return hasher.hexdigest()
+        
+        if URING_AVAILABLE:
+            hasher = hashlib.new(algorithm)
+            try:
+                FirmwareParser._hash_file_uring(file_path, hasher)
+                return hasher.hexdigest()
+            except (OSError, AttributeError, TypeError):
+                # Kernel sem io_uring ou versão incompatível do liburing
+                pass
+        
+        hasher = hashlib.new(algorithm)
+        fd = FirmwareParser._open_sequential(file_path)
+        try:
+            buffers = [bytearray(HASH_CHUNK_SIZE), bytearray(HASH_CHUNK_SIZE)]
+            FirmwareParser._hash_fd_pipelined(fd, buffers, hasher)
+        finally:
+            FirmwareParser._close_sequential(fd)
+        
+        return hasher.hexdigest()
+    
+    @staticmethod
+    def _hash_fd_pipelined(fd: int, buffers: list, hasher) -> None:
+        """Lê e calcula o hash em paralelo com dois buffers alternados
+        
+        Uma thread lê o próximo bloco enquanto o bloco atual é processado; tanto
+        a leitura quanto hashlib liberam o GIL, então as duas etapas se sobrepõem.
+        """
+        filled = [threading.Event(), threading.Event()]
+        consumed = [threading.Event(), threading.Event()]
+        sizes = [0, 0]
+        errors = []
+        stop = threading.Event()
+        for event in consumed:
+            event.set()
+        
+        def reader():
+            index = 0
+            try:
+                while True:
+                    consumed[index].wait()
+                    consumed[index].clear()
+                    if stop.is_set():
+                        return
+                    sizes[index] = os.readv(fd, [buffers[index]])
+                    filled[index].set()
+                    if not sizes[index]:
+                        return
+                    index ^= 1
+            except OSError as e:
+                errors.append(e)
+                sizes[index] = 0
+                filled[index].set()
+        
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        
+        views = [memoryview(buffer) for buffer in buffers]
+        try:
+            index = 0
+            while True:
+                filled[index].wait()
+                filled[index].clear()
+                if not sizes[index]:
+                    break
+                hasher.update(views[index][:sizes[index]])
+                consumed[index].set()
+                index ^= 1
+        finally:
+            # Libera a thread leitora caso o laço tenha sido interrompido
+            stop.set()
+            for event in consumed:
+                event.set()
+            thread.join()
+            for view in views:
+                view.release()
+        
+        if errors:
+            raise errors[0]
+    
+    @staticmethod
+    def _verify_tar_md5(file_path: str, size: int) -> bool:
+        """Confere o MD5 embutido ao final de um pacote .tar.md5
+        
+        O pacote é o tar seguido da linha "<md5>  <nome>.tar" (saída de md5sum);
+        só o trecho do tar é mapeado e o trailer é lido com um único pread.
+        """
+        with open(file_path, 'rb') as f:
+            tail_size = min(size, TAR_MD5_TRAILER_MAX)
+            tail = os.pread(f.fileno(), tail_size, size - tail_size)
+        
+        # O trailer começa após o último byte nulo (preenchimento do tar) ou quebra de linha
+        line = tail.rstrip(b"\n")
+        start = max(line.rfind(b"\x00"), line.rfind(b"\n")) + 1
+        fields = line[start:].split()
+        if not fields or len(fields[0]) != 32:
+            return False
+        
+        expected = fields[0].decode('ascii', 'replace').lower()
+        body_size = size - (tail_size - start)
+        
+        hasher = hashlib.md5()
+        if not FirmwareParser._hash_file_mmap(file_path, hasher, body_size):
+            with open(file_path, 'rb') as f:
+                remaining = body_size
+                while remaining:
+                    chunk = f.read(min(HASH_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        return False
+                    hasher.update(chunk)
+                    remaining -= len(chunk)
+        
+        return hasher.hexdigest() == expected
+    
+    @staticmethod
+    def expected_checksum(file_path: str) -> Optional[Tuple[str, str]]:
+        """Retorna (algoritmo, hash esperado) do primeiro arquivo de checksum encontrado
+        
+        MD5 tem prioridade, pois é o formato usado pela Samsung.
+        """
+        for extension, algorithm in CHECKSUM_SIDECARS:
+            checksum_file = file_path + extension
+            if algorithm == 'blake3' and not BLAKE3_AVAILABLE:
+                continue
+            if os.path.exists(checksum_file):
+                with open(checksum_file, 'r') as f:
+                    return algorithm, f.read().strip().split()[0].lower()
+        return None
+    
+    @staticmethod
+    def new_hasher(algorithm: str):
+        """Cria um objeto de hash incremental para o algoritmo informado"""
+        if algorithm == 'blake3':
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return hashlib.new(algorithm)
+    
+    @staticmethod
+    def verify_firmware_integrity(file_path: str,
+                                  file_stat: Optional[os.stat_result] = None) -> bool:
+        """Verifica integridade do firmware (file_stat evita um novo stat do arquivo)"""
+        try:
+            checksum = FirmwareParser.expected_checksum(file_path)
+            if checksum:
+                algorithm, expected = checksum
+                return FirmwareParser.hash_file(file_path, algorithm).lower() == expected
+            
+            # Pacotes .tar.md5 da Samsung trazem o MD5 do tar anexado ao final
+            if file_path.endswith('.tar.md5'):
+                if file_stat is None:
+                    file_stat = os.stat(file_path)
+                return FirmwareParser._verify_tar_md5(file_path, file_stat.st_size)
+            
+            # Se não há arquivo de checksum, assume que está correto
             return True
             
         except Exception:
@@ -502,6 +880,8 @@ class ZodinFlashEngine:
         self.progress_callback = progress_callback
         self.log_callback = log_callback
         self.connected_device = None
+        # Resultado da verificação de integridade do último flash (caminho -> válido)
+        self.integrity_results: Dict[str, bool] = {}
     
     def log(self, message: str):
         """Envia mensagem para callback de log"""
@@ -526,8 +906,18 @@ class ZodinFlashEngine:
         
         return self.protocol.get_device_info()
     
-    def flash_firmware_files(self, firmware_files: Dict[str, str]) -> bool:
-        """Faz flash de múltiplos arquivos de firmware"""
+    def flash_firmware_files(self, firmware_files: Dict[str, str],
+                             verify_integrity: bool = True,
+                             known_integrity: Optional[Dict[str, bool]] = None) -> bool:
+        """Faz flash de múltiplos arquivos de firmware
+        
+        known_integrity traz resultados já conhecidos (caminho -> válido) para os
+        arquivos inalterados, reportados antes do envio sem reler o firmware. Arquivos
+        únicos com checksum sem resultado conhecido têm o hash calculado durante o
+        próprio envio, então uma divergência só é detectada após a gravação.
+        """
+        known_integrity = known_integrity or {}
+        self.integrity_results = {}
         try:
             if not self.connected_device:
                 self.log("Nenhum dispositivo conectado")
@@ -539,29 +929,55 @@ class ZodinFlashEngine:
             for file_type, file_path in firmware_files.items():
                 self.log(f"Processando arquivo {file_type}: {os.path.basename(file_path)}")
                 
-                # Verifica integridade
-                if not FirmwareParser.verify_firmware_integrity(file_path):
-                    self.log(f"⚠️ Aviso: Falha na verificação de integridade de {file_type}")
+                # Arquivos com checksum são verificados durante o envio
+                checksum = None
+                known = known_integrity.get(file_path) if verify_integrity else None
+                if known is not None:
+                    # Resultado já conhecido para o arquivo inalterado: reporta antes do envio
+                    if not known:
+                        self.log(f"⚠️ Aviso: Falha na verificação de integridade de {file_type}")
+                elif verify_integrity and not file_path.endswith('.tar'):
+                    checksum = FirmwareParser.expected_checksum(file_path)
+                
+                # Verifica integridade antes do envio
+                if verify_integrity and known is None and not checksum:
+                    valid = FirmwareParser.verify_firmware_integrity(file_path)
+                    self.integrity_results[file_path] = valid
+                    if not valid:
+                        self.log(f"⚠️ Aviso: Falha na verificação de integridade de {file_type}")
+                
+                if checksum:
+                    self.log(f"🔐 {file_type}: checksum conferido durante o envio; "
+                             f"uma divergência só será detectada após a gravação")
                 
                 # Determina como processar o arquivo
                 if file_path.endswith('.tar'):
-                    # Arquivo TAR - extrai partições
-                    firmware_data = FirmwareParser.parse_tar_firmware(file_path)
-                    
-                    for partition_name, data in firmware_data.items():
-                        if not self.protocol.flash_partition(partition_name, data, self.progress_callback):
+                    # Arquivo TAR - cada partição é enviada direto do pacote, sem extraí-la
+                    for partition_name, size, chunks in FirmwareParser.iter_tar_firmware(file_path):
+                        if not self.protocol.flash_partition_stream(partition_name, chunks, size,
+                                                                    self.progress_callback):
                             self.log(f"Falha no flash da partição {partition_name}")
                             return False
                 
                 else:
-                    # Arquivo único
-                    with open(file_path, 'rb') as f:
-                        data = f.read()
+                    # Arquivo único: lido em blocos enquanto é enviado, sem carregá-lo
+                    # inteiro na memória
+                    total_bytes = os.path.getsize(file_path)
+                    chunks = FirmwareParser.iter_file_chunks(file_path, FLASH_CHUNK_SIZE)
                     
                     partition_name = file_type.upper()
-                    if not self.protocol.flash_partition(partition_name, data, self.progress_callback):
+                    hasher = FirmwareParser.new_hasher(checksum[0]) if checksum else None
+                    if not self.protocol.flash_partition_stream(partition_name, chunks, total_bytes,
+                                                                self.progress_callback, hasher):
                         self.log(f"Falha no flash da partição {partition_name}")
                         return False
+                    
+                    if hasher is not None:
+                        valid = hasher.hexdigest().lower() == checksum[1]
+                        self.integrity_results[file_path] = valid
+                        if not valid:
+                            self.log(f"⚠️ Aviso: Falha na verificação de integridade de {file_type} "
+                                     f"(o conteúdo já foi gravado no dispositivo)")
             
             self.log("Flash concluído com sucesso!")
             return True
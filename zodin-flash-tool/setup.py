@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Zodin Flash Tool - Compilação opcional com Cython
+Compila a interface (zodin_gui.py) como módulo nativo para reduzir o
+custo do interpretador nos slots Qt. O arquivo .py continua sendo a fonte e
+funciona normalmente em instalações sem o módulo compilado.
+
+Uso:
+    pip install cython
+    python3 setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit("❌ Cython não está instalado. Instale com: pip install cython")
+
+
+setup(
+    name="zodin-flash-tool",
+    version="1.1.0",
+    ext_modules=cythonize(
+        ["zodin_gui.py"],
+        language_level=3,
+        compiler_directives={"binding": True},
+    ),
+    zip_safe=False,
+)
@@ -32,6 +32,17 @@ except ImportError:
     QTimer = None
     Qt = None
 
+# orjson é opcional: decodificação/codificação JSON em C
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Tamanho dos blocos lidos da resposta HTTP durante o download (1 MiB)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class UpdateInfo:
     """Informações sobre uma atualização disponível"""
@@ -63,7 +74,7 @@ class UpdateChecker(QThread):
             response = requests.get(self.github_api_url, timeout=10)
             response.raise_for_status()
             
-            release_data = response.json()
+            release_data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             latest_version = release_data['tag_name'].lstrip('v')
             
             if self._is_newer_version(latest_version, self.current_version):
@@ -144,16 +155,20 @@ class UpdateDownloader(QThread):
             
             total_size = int(response.headers.get('content-length', 0))
             downloaded = 0
+            last_progress = -1
             
             with open(self.download_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
                         
+                        # Emite apenas quando a porcentagem muda
                         if total_size > 0:
                             progress = int((downloaded / total_size) * 100)
-                            self.progress_updated.emit(progress)
+                            if progress != last_progress:
+                                last_progress = progress
+                                self.progress_updated.emit(progress)
             
             self.download_completed.emit(self.download_path)
             
@@ -224,6 +239,12 @@ class UpdateInstaller:
                 if not zodin_dir:
                     return False
                 
+                # Remove módulos compilados com Cython da versão anterior,
+                # que teriam prioridade sobre os novos arquivos .py
+                for pattern in ('zodin_flash_tool.*.so', 'zodin_gui.*.so'):
+                    for compiled in self.app_dir.glob(pattern):
+                        compiled.unlink()
+                
                 # Copia arquivos para o diretório de instalação
                 for item in os.listdir(zodin_dir):
                     src = os.path.join(zodin_dir, item)
@@ -247,7 +268,7 @@ class UpdateInstaller:
         """Verifica se a instalação foi bem-sucedida"""
         try:
             # Verifica se arquivos principais existem
-            required_files = ['zodin_flash_tool.py', 'samsung_protocol.py']
+            required_files = ['zodin_flash_tool.py', 'zodin_gui.py', 'samsung_protocol.py']
             for file in required_files:
                 if not (self.app_dir / file).exists():
                     return False
@@ -482,10 +503,11 @@ class ZodinUpdater:
         
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    # Mescla com configurações padrão
-                    default_config.update(config)
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+                # Mescla com configurações padrão
+                default_config.update(config)
             return default_config
         except Exception:
             return default_config
@@ -493,8 +515,12 @@ class ZodinUpdater:
     def _save_config(self):
         """Salva configurações de atualização"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=2).encode()
+            with open(self.config_file, 'wb') as f:
+                f.write(data)
         except Exception:
             pass
     
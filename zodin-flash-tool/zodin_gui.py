@@ -0,0 +1,2659 @@
+#!/usr/bin/env python3
+"""
+Zodin Flash Tool - Interface Gráfica
+Interface gráfica moderna e intuitiva para flash de dispositivos Samsung
+"""
+
+import os
+import sys
+import time
+import threading
+import json
+import functools
+import math
+import weakref
+import select
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any
+
+# Adiciona o diretório atual ao path para importações locais
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+# Configuração do ambiente Qt para suportar ambientes headless
+if 'DISPLAY' not in os.environ:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+else:
+    os.environ.setdefault('QT_QPA_PLATFORM', 'xcb')
+
+try:
+    from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                                QHBoxLayout, QTabWidget, QLabel, QPushButton, 
+                                QProgressBar, QPlainTextEdit, QFileDialog, QMessageBox,
+                                QGroupBox, QCheckBox, QSpinBox, QComboBox, QFrame,
+                                QSplitter, QListWidget, QListWidgetItem, QGridLayout,
+                                QScrollArea, QSizePolicy, QDialog, QProgressDialog,
+                                QLineEdit, QGraphicsOpacityEffect)
+    from PyQt6.QtGui import (QColor, QPalette, QPainter, QBrush, QLinearGradient,
+                             QGradient, QPixmap, QTextCursor)
+
+    from PyQt6.QtCore import (Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, 
+                             QEasingCurve, QRect, QRectF, QParallelAnimationGroup, 
+                             QSequentialAnimationGroup, QAbstractAnimation, QTranslator, QLocale,
+                             QObject, QRunnable, QThreadPool, QEvent, pyqtSlot)
+
+
+
+except ImportError as e:
+    print(f"❌ Erro ao importar PyQt6: {e}")
+    print("💡 Instale com: pip install PyQt6")
+    sys.exit(1)
+
+try:
+    from samsung_protocol import (ZodinFlashEngine, SamsungDevice, SamsungMode, 
+                                 FlashProgress, FirmwareParser, CHECKSUM_SIDECARS)
+except ImportError as e:
+    print(f"❌ Erro ao importar samsung_protocol: {e}")
+    print(f"📁 Diretório atual: {current_dir}")
+    print(f"🔍 Arquivos disponíveis: {os.listdir(current_dir)}")
+    sys.exit(1)
+
+try:
+    from updater import ZodinUpdater
+except ImportError as e:
+    print(f"❌ Erro ao importar updater: {e}")
+    print("⚠️ Sistema de atualização desabilitado")
+    ZodinUpdater = None
+
+# pyudev é opcional: eventos de hotplug USB em vez de varrer o barramento periodicamente
+try:
+    import pyudev
+    PYUDEV_AVAILABLE = True
+except ImportError:
+    PYUDEV_AVAILABLE = False
+
+# orjson é opcional: leitura/escrita mais rápida do cache de integridade
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Temas claro/escuro da aplicação (ver _APP_STYLE_* e apply_modern_style)
+_MAIN_STYLE_DARK = """
+    QMainWindow {
+        background-color: #2c3e50; /* Dark Blue-Grey */
+        color: #ecf0f1; /* Light Grey */
+    }
+    QTabWidget::pane {
+        border: none;
+        border-top: 3px solid #3498db; /* Blue */
+    }
+    QTabBar::tab {
+        background: #34495e; /* Darker Blue-Grey */
+        color: #ecf0f1;
+        padding: 15px 30px;
+        font-size: 14px;
+        font-weight: bold;
+        border-top-left-radius: 10px;
+        border-top-right-radius: 10px;
+        min-width: 150px;
+    }
+    QTabBar::tab:selected {
+        background: #3498db;
+        color: white;
+    }
+    QTabBar::tab:hover {
+        background: #2980b9; /* Slightly darker blue */
+    }
+    QGroupBox {
+        font-size: 16px;
+        font-weight: bold;
+        color: #ecf0f1;
+        border: 2px solid #34495e;
+        border-radius: 15px;
+        margin-top: 10px;
+        padding: 20px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 10px;
+        background-color: #2c3e50;
+    }
+    QLabel {
+        font-size: 14px;
+        color: #ecf0f1;
+    }
+    QPlainTextEdit {
+        background-color: #34495e;
+        border: 2px solid #2980b9;
+        border-radius: 10px;
+        padding: 10px;
+        font-family: 'monospace';
+        font-size: 13px;
+        color: #ecf0f1;
+    }
+    QListWidget {
+        background-color: #34495e;
+        border: 2px solid #2980b9;
+        border-radius: 10px;
+        padding: 10px;
+    }
+    QListWidget::item {
+        padding: 12px;
+        border-bottom: 1px solid #2c3e50;
+    }
+    QListWidget::item:selected {
+        background-color: #3498db;
+        color: white;
+        border-radius: 8px;
+    }
+    QCheckBox {
+        spacing: 10px;
+        font-size: 14px;
+        color: #ecf0f1;
+    }
+    QCheckBox::indicator {
+        width: 20px;
+        height: 20px;
+        border: 2px solid #3498db;
+        border-radius: 10px;
+        background-color: #2c3e50;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #3498db;
+    }
+"""
+
+_MAIN_STYLE_LIGHT = """
+    QMainWindow {
+        background-color: #ecf0f1; /* Light Grey Background */
+        color: #2c3e50; /* Dark Blue-Grey */
+    }
+    QTabWidget::pane {
+        border: none;
+        border-top: 3px solid #3498db; /* Blue */
+    }
+    QTabBar::tab {
+        background: #bdc3c7; /* Medium Grey */
+        color: #2c3e50;
+        padding: 15px 30px;
+        font-size: 14px;
+        font-weight: bold;
+        border-top-left-radius: 10px;
+        border-top-right-radius: 10px;
+        min-width: 150px;
+    }
+    QTabBar::tab:selected {
+        background: #3498db;
+        color: white;
+    }
+    QTabBar::tab:hover {
+        background: #aeb6bf; /* Slightly darker grey */
+    }
+    QGroupBox {
+        font-size: 16px;
+        font-weight: bold;
+        color: #2c3e50;
+        border: 2px solid #bdc3c7;
+        border-radius: 15px;
+        margin-top: 10px;
+        padding: 20px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 10px;
+        background-color: #ecf0f1;
+    }
+    QLabel {
+        font-size: 14px;
+        color: #2c3e50;
+    }
+    QPlainTextEdit {
+        background-color: #ffffff;
+        border: 2px solid #bdc3c7;
+        border-radius: 10px;
+        padding: 10px;
+        font-family: 'monospace';
+        font-size: 13px;
+        color: #2c3e50;
+    }
+    QListWidget {
+        background-color: #ffffff;
+        border: 2px solid #bdc3c7;
+        border-radius: 10px;
+        padding: 10px;
+    }
+    QListWidget::item {
+        padding: 12px;
+        border-bottom: 1px solid #ecf0f1;
+    }
+    QListWidget::item:selected {
+        background-color: #3498db;
+        color: white;
+        border-radius: 8px;
+    }
+    QCheckBox {
+        spacing: 10px;
+        font-size: 14px;
+        color: #2c3e50;
+    }
+    QCheckBox::indicator {
+        width: 20px;
+        height: 20px;
+        border: 2px solid #3498db;
+        border-radius: 10px;
+        background-color: #ffffff;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #3498db;
+    }
+"""
+
+
+# Estilo estrutural compartilhado pelos campos da aba de configurações;
+# as cores vêm de uma QPalette (ver _build_settings_palette)
+_SETTINGS_INPUT_QSS = """
+    QSpinBox#settingsInput, QComboBox#settingsInput {
+        padding: 8px;
+        font-size: 14px;
+        border: 2px solid #ddd;
+        border-radius: 8px;
+    }
+"""
+
+
+def _set_stylesheet(widget, qss: str):
+    """Aplica o stylesheet apenas quando difere do último aplicado ao widget"""
+    last_qss = getattr(widget, '_last_qss', None)
+    if last_qss is qss or last_qss == qss:
+        return
+    widget._last_qss = qss
+    widget.setStyleSheet(qss)
+
+# Modelos HTML dos diálogos de informações e de confirmação de flash
+_INFO_HTML = """
+<h3>📁 Informações do Arquivo {file_type}</h3>
+<p><b>Nome:</b> {name}</p>
+<p><b>Caminho:</b> {path}</p>
+<p><b>Tamanho:</b> {size_mb:.2f} MB ({size:,} bytes)</p>
+<p><b>Tipo:</b> {file_type}</p>
+<p><b>Integridade:</b> {integrity}</p>
+"""
+
+_CONFIRM_HTML = """
+<h2>⚠️ Confirmação de Flash</h2>
+<p><b>Dispositivo:</b> {device}</p>
+<p><b>Arquivos selecionados:</b></p>
+{files}
+<p style="color: red;"><b>⚠️ ATENÇÃO:</b> Esta operação irá sobrescrever o firmware!</p>
+<p>• Pode anular a garantia do dispositivo</p>
+<p>• Mantenha o dispositivo conectado durante todo o processo</p>
+<br>
+<p>Deseja continuar?</p>
+"""
+
+# Descrição em HTML da aba Sobre
+_ABOUT_HTML = """
+<div style="text-align: center; line-height: 1.8;">
+<h2 style="color: #6c5ce7;">🚀 A Revolução do Flash Samsung no Linux</h2>
+
+<p style="font-size: 16px; margin: 20px 0;">
+O <b>Zodin Flash Tool</b> representa uma nova era nas ferramentas de flash Samsung para Linux. 
+Combinando o conhecimento e as melhores práticas de todas as ferramentas existentes, 
+criamos uma experiência única, moderna e poderosa.
+</p>
+
+<h3 style="color: #00b894;">✨ Características Revolucionárias:</h3>
+<div style="text-align: left; max-width: 600px; margin: 0 auto;">
+<p>🎨 <b>Interface Moderna:</b> Design fluido com animações suaves</p>
+<p>⚡ <b>Protocolo Próprio:</b> Implementação nativa dos protocolos Samsung</p>
+<p>🔧 <b>Detecção Inteligente:</b> Reconhecimento automático de dispositivos</p>
+<p>🛡️ <b>Segurança Avançada:</b> Verificações de integridade integradas</p>
+<p>📊 <b>Progresso Visual:</b> Feedback em tempo real com animações</p>
+<p>🌟 <b>Experiência Única:</b> Fusão do melhor de todas as ferramentas</p>
+</div>
+
+<h3 style="color: #e17055;">💡 Inovação Tecnológica:</h3>
+<p style="font-size: 14px; color: #636e72;">
+Diferente de outras ferramentas que dependem de binários externos, o Zodin implementa 
+seus próprios protocolos de comunicação Samsung, oferecendo controle total e 
+performance otimizada.
+</p>
+
+<p style="margin-top: 30px; font-style: italic; color: #6c5ce7;">
+"Desenvolvido com ❤️ para elevar o padrão das ferramentas Linux"
+</p>
+</div>
+"""
+
+# Filtros dos diálogos de arquivo (firmware e log)
+_FW_FILTER = "Arquivos de firmware (*.tar *.md5 *.bin *.img *.tar.md5);;Todos os arquivos (*.*)"
+_TXT_FILTER = "Arquivos de texto (*.txt);;Todos os arquivos (*.*)"
+
+
+def _parse_cpu_list(text: str) -> set:
+    """Converte uma lista de CPUs do sysfs (ex.: "0-3,8") em um conjunto"""
+    cpus = set()
+    for part in text.strip().split(','):
+        if '-' in part:
+            first, last = part.split('-')
+            cpus.update(range(int(first), int(last) + 1))
+        elif part:
+            cpus.add(int(part))
+    return cpus
+
+
+def _performance_cpus(allowed: List[int]) -> List[int]:
+    """Filtra as CPUs de desempenho: P-cores em CPUs híbridas ou as de maior frequência"""
+    # CPUs híbridas da Intel listam os P-cores em cpu_core (os E-cores ficam em cpu_atom)
+    try:
+        with open("/sys/devices/cpu_core/cpus") as f:
+            p_cores = [cpu for cpu in allowed if cpu in _parse_cpu_list(f.read())]
+        if p_cores:
+            return p_cores
+    except (OSError, ValueError):
+        pass
+    
+    # Demais arquiteturas heterogêneas (ex.: big.LITTLE): maior frequência máxima
+    max_freqs = {}
+    for cpu in allowed:
+        try:
+            with open(f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/cpuinfo_max_freq") as f:
+                max_freqs[cpu] = int(f.read())
+        except (OSError, ValueError):
+            return allowed
+    top = max(max_freqs.values())
+    return [cpu for cpu in allowed if max_freqs[cpu] == top]
+
+
+def _pick_flash_cpu() -> Optional[int]:
+    """Escolhe uma CPU física para o flash: o primeiro núcleo de desempenho permitido"""
+    try:
+        allowed = sorted(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return None
+    if len(allowed) < 2:
+        return None
+    
+    candidates = _performance_cpus(allowed)
+    for cpu in candidates:
+        try:
+            with open(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list") as f:
+                siblings = _parse_cpu_list(f.read())
+        except (OSError, ValueError):
+            return cpu
+        # Usa só a primeira thread de cada núcleo, deixando a irmã livre
+        if min(siblings) == cpu:
+            return cpu
+    return candidates[0]
+
+
+# Estilos de AnimatedButton, selecionados pela propriedade "kind" (ver AnimatedButton.setup_style)
+_BUTTON_QSS_DANGER = """
+    QPushButton[kind="danger"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #ff6b6b, stop:1 #ee5a52);
+        color: white;
+        border: none;
+        border-bottom: 3px solid rgba(0, 0, 0, 40);
+        border-radius: 12px;
+        padding: 15px 30px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 120px;
+    }
+    QPushButton[kind="danger"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #ff7979, stop:1 #fd6c6c);
+    }
+    QPushButton[kind="danger"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #e55656, stop:1 #d63447);
+    }
+    QPushButton[kind="danger"]:disabled {
+        background: #bdc3c7;
+        color: #7f8c8d;
+    }
+"""
+
+_BUTTON_QSS_SUCCESS = """
+    QPushButton[kind="success"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #00b894, stop:1 #00a085);
+        color: white;
+        border: none;
+        border-bottom: 3px solid rgba(0, 0, 0, 40);
+        border-radius: 12px;
+        padding: 15px 30px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 120px;
+    }
+    QPushButton[kind="success"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #00cec9, stop:1 #00b894);
+    }
+    QPushButton[kind="success"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #00a085, stop:1 #008f7a);
+    }
+"""
+
+_BUTTON_QSS_PRIMARY = """
+    QPushButton[kind="primary"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #6c5ce7, stop:1 #5f3dc4);
+        color: white;
+        border: none;
+        border-bottom: 3px solid rgba(0, 0, 0, 40);
+        border-radius: 12px;
+        padding: 15px 30px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 120px;
+    }
+    QPushButton[kind="primary"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #7d6ef0, stop:1 #6c5ce7);
+    }
+    QPushButton[kind="primary"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #5f3dc4, stop:1 #4c3baf);
+    }
+    QPushButton[kind="primary"]:disabled {
+        background: #bdc3c7;
+        color: #7f8c8d;
+    }
+"""
+
+_BUTTON_QSS_DEFAULT = """
+    QPushButton[kind="default"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #ffffff, stop:1 #f8f9fa);
+        color: #2d3436;
+        border: 2px solid #ddd;
+        border-radius: 12px;
+        padding: 12px 25px;
+        font-size: 13px;
+        font-weight: 500;
+        min-width: 100px;
+    }
+    QPushButton[kind="default"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #f8f9fa, stop:1 #e9ecef);
+        border-color: #6c5ce7;
+    }
+    QPushButton[kind="default"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #e9ecef, stop:1 #dee2e6);
+    }
+"""
+
+_BUTTON_QSS = _BUTTON_QSS_DANGER + _BUTTON_QSS_SUCCESS + _BUTTON_QSS_PRIMARY + _BUTTON_QSS_DEFAULT
+
+
+class AnimatedButton(QPushButton):
+    """Botão com animações fluidas"""
+    def __init__(self, text, primary=False, danger=False, success=False):
+        super().__init__(text)
+        self.primary = primary
+        self.danger = danger
+        self.success = success
+        self.setup_style()
+    
+    def setup_style(self):
+        if self.danger:
+            kind = 'danger'
+        elif self.success:
+            kind = 'success'
+        elif self.primary:
+            kind = 'primary'
+        else:
+            kind = 'default'
+        self.setProperty("kind", kind)
+
+
+class AnimatedProgressBar(QProgressBar):
+    """Barra de progresso com animações"""
+    def __init__(self):
+        super().__init__()
+        self.setup_style()
+        self.pulse_animation = None
+        self.setup_animations()
+        
+        # Animação única reaproveitada a cada novo valor
+        self._value_anim = QPropertyAnimation(self, b"value", self)
+        self._value_anim.setDuration(300)
+        self._value_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+    
+    def setup_style(self):
+        self.setObjectName("flashProgress")
+    
+    def setup_animations(self):
+        # Animação de pulso quando ativo
+        self.pulse_animation = QPropertyAnimation(self, b"value")
+        self.pulse_animation.setDuration(1000)
+        self.pulse_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+    
+    def setValue(self, value):
+        """Override para adicionar animação suave"""
+        running = self._value_anim.state() == QAbstractAnimation.State.Running
+        if running and self._value_anim.endValue() == value:
+            return
+        
+        # Passos de até 2% durante uma animação em curso vão direto ao valor
+        self._value_anim.stop()
+        span = max(self.maximum() - self.minimum(), 1)
+        if running and abs(value - self.value()) * 100 <= 2 * span:
+            super().setValue(value)
+            return
+        
+        self._value_anim.setStartValue(self.value())
+        self._value_anim.setEndValue(value)
+        self._value_anim.start()
+
+
+# Estilo das linhas de arquivo da aba de flash, selecionado pelo objectName de cada widget
+_FILE_ROW_QSS = """
+    QFrame#fileRow {
+        background-color: white;
+        border: 2px solid #e9ecef;
+        border-radius: 12px;
+        margin: 5px;
+        padding: 10px;
+    }
+    QFrame#fileRow:hover {
+        border-color: #6c5ce7;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #ffffff, stop:1 #f8f9ff);
+    }
+    QCheckBox#fileRowCheck::indicator {
+        width: 25px;
+        height: 25px;
+        border-radius: 12px;
+        border: 3px solid #ddd;
+        background-color: white;
+    }
+    QCheckBox#fileRowCheck::indicator:checked {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #6c5ce7, stop:1 #5f3dc4);
+        border-color: #6c5ce7;
+    }
+    QLabel#fileRowIcon {
+        font-size: 24px;
+        margin: 5px;
+    }
+    QLabel#fileRowType {
+        font-size: 16px;
+        font-weight: bold;
+        color: #2d3436;
+        margin-bottom: 5px;
+    }
+    QLabel#fileRowDesc {
+        font-size: 12px;
+        color: #636e72;
+        margin-bottom: 10px;
+    }
+    QLineEdit#fileRowPath {
+        padding: 12px 15px;
+        font-size: 13px;
+        border: 2px solid #e9ecef;
+        border-radius: 8px;
+        background-color: #f8f9fa;
+    }
+    QLineEdit#fileRowPath:focus {
+        border-color: #6c5ce7;
+        background-color: white;
+    }
+    QLineEdit#fileRowPath[highlight="true"] {
+        border: 3px solid #00b894;
+    }
+"""
+
+# Número máximo de linhas mantidas no log da interface
+_LOG_MAX_BLOCKS = 2000
+
+# Número máximo de linhas aguardando descarregamento no log (mais que isso
+# seria descartado pelo próprio limite do log)
+_LOG_BUFFER_MAX = _LOG_MAX_BLOCKS
+
+
+# Cor e alcance (em pixels) do brilho pré-renderizado de GlowingLabel
+_GLOW_COLOR = QColor(108, 92, 231, 150)
+_GLOW_RADIUS = 10
+# Níveis discretos de opacidade do brilho: quadros sem mudança de nível não repintam
+_GLOW_LEVELS = 12
+
+
+class GlowingLabel(QLabel):
+    """Label com efeito de brilho"""
+    # Um único timer pulsa todos os labels visíveis; os ocultos não custam nada
+    _visible = weakref.WeakSet()
+    _glow_timer = None
+    
+    def __init__(self, text=""):
+        super().__init__(text)
+        self._glow = 1.0
+        self._glow_pixmap = None
+        self._glow_key = None
+    
+    @classmethod
+    def _tick_glow(cls):
+        """Atualiza a opacidade do brilho de todos os labels visíveis"""
+        phase = 0.5 + 0.5 * math.sin(math.pi * time.monotonic())  # período de 2 s
+        glow = 0.6 + 0.4 * round(phase * _GLOW_LEVELS) / _GLOW_LEVELS
+        for label in list(cls._visible):
+            if label._glow != glow:
+                label._glow = glow
+                label.update()
+    
+    @classmethod
+    def _drop_glow_timer(cls, *_):
+        """Esquece o timer compartilhado destruído junto com a aplicação"""
+        cls._glow_timer = None
+    
+    def showEvent(self, event):
+        cls = GlowingLabel
+        cls._visible.add(self)
+        if cls._glow_timer is None:
+            cls._glow_timer = QTimer(QApplication.instance())
+            cls._glow_timer.setInterval(33)
+            cls._glow_timer.timeout.connect(cls._tick_glow)
+            cls._glow_timer.destroyed.connect(cls._drop_glow_timer)
+        if not cls._glow_timer.isActive():
+            cls._glow_timer.start()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        cls = GlowingLabel
+        cls._visible.discard(self)
+        if not cls._visible and cls._glow_timer is not None:
+            cls._glow_timer.stop()
+        super().hideEvent(event)
+    
+    def _render_glow(self):
+        """Renderiza o brilho do texto uma única vez por tamanho/texto/fonte"""
+        ratio = self.devicePixelRatioF()
+        key = (self.size(), ratio, self.text(), self.font().key())
+        if key == self._glow_key:
+            return self._glow_pixmap
+        
+        # Renderizado na densidade da tela para não borrar em monitores HiDPI
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(self.font())
+        color = QColor(_GLOW_COLOR)
+        color.setAlpha(_GLOW_COLOR.alpha() // 8)
+        painter.setPen(color)
+        
+        # Aproxima o desfoque desenhando o texto em anéis ao redor da posição original
+        rect = self.contentsRect()
+        for radius in range(2, _GLOW_RADIUS + 1, 2):
+            for dx, dy in ((radius, 0), (-radius, 0), (0, radius), (0, -radius),
+                           (radius, radius), (-radius, -radius), (radius, -radius), (-radius, radius)):
+                painter.drawText(rect.translated(dx, dy), self.alignment(), self.text())
+        painter.end()
+        
+        self._glow_pixmap = pixmap
+        self._glow_key = key
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Desenha o brilho em cache sob o texto, sem efeito gráfico por quadro"""
+        painter = QPainter(self)
+        painter.setOpacity(self._glow)
+        painter.drawPixmap(0, 0, self._render_glow())
+        painter.end()
+        super().paintEvent(event)
+
+
+# Estilo do status do dispositivo: caixa cinza até a primeira detecção; depois o
+# fundo em gradiente é pintado por DeviceStatusLabel e a cor do texto vem da paleta
+_DEVICE_STATUS_QSS = """
+    QLabel#deviceStatus {
+        padding: 15px;
+        background-color: #f0f0f0;
+        border: 1px solid #ccc;
+        border-radius: 10px;
+        font-size: 14px;
+        font-weight: bold;
+        color: #333;
+    }
+    QLabel#deviceStatus[painted="true"] {
+        padding: 20px;
+        background: transparent;
+        border: none;
+        font-size: 15px;
+        font-weight: bold;
+    }
+    QLabel#deviceStatus[painted="true"][connected="true"] {
+        color: white;
+    }
+    QLabel#deviceStatus[painted="true"][connected="false"] {
+        color: #2d3436;
+    }
+"""
+
+
+class DeviceStatusLabel(QLabel):
+    """Label de status do dispositivo com gradiente pintado diretamente"""
+    def __init__(self, text=""):
+        super().__init__(text)
+        self._ok_brush = self._make_brush("#00b894", "#00a085")
+        self._search_brush = self._make_brush("#ffeaa7", "#fdcb6e")
+        self._current_brush = None
+    
+    @staticmethod
+    def _make_brush(top, bottom):
+        gradient = QLinearGradient(0, 0, 0, 1)
+        gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+        gradient.setColorAt(0.0, QColor(top))
+        gradient.setColorAt(1.0, QColor(bottom))
+        return QBrush(gradient)
+    
+    def set_connected(self, connected):
+        """Alterna o gradiente entre dispositivo detectado e procurando"""
+        brush = self._ok_brush if connected else self._search_brush
+        if brush is self._current_brush:
+            return
+        
+        # Troca a caixa cinza inicial pelo gradiente pintado (regra [painted="true"]);
+        # a cor do texto de cada estado vem da regra [connected=...]
+        self.setProperty("painted", True)
+        self.setProperty("connected", connected)
+        self._current_brush = brush
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
+    
+    def paintEvent(self, event):
+        if self._current_brush is not None:
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._current_brush)
+            painter.drawRoundedRect(QRectF(self.rect()), 12, 12)
+            painter.end()
+        super().paintEvent(event)
+
+
+class DeviceDetectionThread(QThread):
+    """Thread para detecção de dispositivos com animações"""
+    device_detected = pyqtSignal(list, bool)  # devices, any_connected
+    
+    def __init__(self, flash_engine):
+        super().__init__()
+        self.running = True
+        self.flash_engine = flash_engine
+        # Assinatura (serial, modo) da última lista emitida; só mudanças são emitidas
+        self._last_sig = None
+        # Pipe usado por stop() e rescan() para acordar a espera por eventos do udev;
+        # fechado quando run() termina (o lock evita escrever num descritor já fechado)
+        self._wake_r, self._wake_w = os.pipe()
+        self._wake_lock = threading.Lock()
+    
+    def detect(self):
+        """Detecta os dispositivos e emite o resultado quando a lista muda"""
+        try:
+            devices = self.flash_engine.detect_devices()
+        except Exception as e:
+            devices = []
+        
+        sig = tuple(sorted((d.serial_number, d.mode.value) for d in devices))
+        if sig != self._last_sig:
+            self._last_sig = sig
+            self.device_detected.emit(devices, len(devices) > 0)
+        return len(devices) > 0
+    
+    def run(self):
+        try:
+            self._detect_loop()
+        finally:
+            with self._wake_lock:
+                os.close(self._wake_r)
+                os.close(self._wake_w)
+                self._wake_r = self._wake_w = -1
+    
+    def _detect_loop(self):
+        connected = self.detect()
+        
+        if PYUDEV_AVAILABLE:
+            try:
+                monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+                monitor.filter_by('usb', device_type='usb_device')
+                monitor.start()
+            except Exception:
+                monitor = None
+            
+            if monitor is not None:
+                self._watch_udev(monitor)
+                return
+        
+        while self.running:
+            # Sem dispositivos conectados, verifica com menos frequência
+            readable, _, _ = select.select([self._wake_r], [], [], 2.0 if connected else 5.0)
+            if readable:
+                os.read(self._wake_r, 64)
+            if self.running:
+                connected = self.detect()
+    
+    def _watch_udev(self, monitor):
+        """Detecta dispositivos apenas quando o udev anuncia um evento USB"""
+        while self.running:
+            readable, _, _ = select.select([monitor, self._wake_r], [], [])
+            if not self.running:
+                break
+            if self._wake_r in readable:
+                # Nova varredura pedida por rescan() (ex.: mudança de estado do ADB)
+                os.read(self._wake_r, 64)
+            
+            # Esvazia a rajada de eventos de um mesmo plug/unplug antes de detectar
+            while monitor.poll(timeout=0) is not None:
+                pass
+            self.detect()
+    
+    def _wake(self):
+        """Acorda a thread, se ela ainda estiver rodando"""
+        with self._wake_lock:
+            if self._wake_w >= 0:
+                os.write(self._wake_w, b"\0")
+    
+    def rescan(self):
+        """Pede uma nova detecção sem esperar por um evento do udev"""
+        self._wake()
+    
+    def stop(self):
+        self.running = False
+        self._wake()
+
+
+class ConnectSignals(QObject):
+    """Sinais emitidos pela conexão a um dispositivo"""
+    connected = pyqtSignal(object, bool)  # SamsungDevice, sucesso
+
+
+class ConnectRunnable(QRunnable):
+    """Conecta ao dispositivo fora da thread da interface (handshake USB bloqueante)"""
+    
+    def __init__(self, flash_engine, device):
+        super().__init__()
+        self.signals = ConnectSignals()
+        self.flash_engine = flash_engine
+        self.device = device
+    
+    def run(self):
+        try:
+            ok = self.flash_engine.connect_device(self.device)
+        except Exception:
+            ok = False
+        self.signals.connected.emit(self.device, ok)
+
+
+class FlashSignals(QObject):
+    """Sinais emitidos pela tarefa de flash"""
+    flash_completed = pyqtSignal(bool, str)
+
+
+class FlashRunnable(QRunnable):
+    """Tarefa de flash executada no pool de threads compartilhado"""
+    
+    def __init__(self, flash_engine, firmware_files, options):
+        super().__init__()
+        self.signals = FlashSignals()
+        self.flash_engine = flash_engine
+        self.firmware_files = firmware_files
+        self.options = options
+    
+    def run(self):
+        # Fixa a thread num único núcleo durante as transferências USB (evita migrações);
+        # a afinidade é restaurada ao final, pois a thread volta para o pool
+        previous_affinity = None
+        cpu = _pick_flash_cpu()
+        if cpu is not None:
+            try:
+                previous_affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, {cpu})
+            except OSError:
+                previous_affinity = None
+        
+        try:
+            success = self.flash_engine.flash_firmware_files(
+                self.firmware_files,
+                verify_integrity=self.options.get('verify_integrity', True),
+                known_integrity=self.options.get('known_integrity')
+            )
+            
+            if success:
+                self.signals.flash_completed.emit(True, "Flash concluído com sucesso! 🎉")
+            else:
+                self.signals.flash_completed.emit(False, "Operação de flash falhou! ❌")
+                
+        except Exception as e:
+            self.signals.flash_completed.emit(False, f"Erro no flash: {str(e)}")
+        finally:
+            if previous_affinity is not None:
+                try:
+                    os.sched_setaffinity(0, previous_affinity)
+                except OSError:
+                    # O cpuset pode ter mudado durante o flash
+                    pass
+
+
+class FileInfoSignals(QObject):
+    """Sinais emitidos pela verificação de informações do arquivo"""
+    info_ready = pyqtSignal(str, str)  # título, HTML
+    info_failed = pyqtSignal(str)
+
+
+class FileInfoRunnable(QRunnable):
+    """Monta as informações de um arquivo, consultando e verificando fora da thread da interface"""
+    
+    def __init__(self, verify, file_type, file_path):
+        super().__init__()
+        self.signals = FileInfoSignals()
+        self.verify = verify
+        self.file_type = file_type
+        self.file_path = file_path
+    
+    def run(self):
+        try:
+            # Um único stat, sempre atual: a chave do cache de integridade inclui o mtime
+            file_stat = os.stat(self.file_path)
+            
+            if self.verify is None:
+                integrity_status = "✅ Válido"
+            elif self.verify(self.file_path, file_stat):
+                integrity_status = "✅ Integridade Verificada"
+            else:
+                integrity_status = "⚠️ Falha na Verificação"
+            
+            self.signals.info_ready.emit(
+                f"Informações - {self.file_type}",
+                _INFO_HTML.format_map({
+                    'file_type': self.file_type,
+                    'name': os.path.basename(self.file_path),
+                    'path': self.file_path,
+                    'size_mb': file_stat.st_size / (1024 * 1024),
+                    'size': file_stat.st_size,
+                    'integrity': integrity_status
+                })
+            )
+        except Exception as e:
+            self.signals.info_failed.emit(str(e))
+
+
+class VerifySignals(QObject):
+    """Sinais emitidos pela verificação de integridade dos arquivos selecionados"""
+    verification_done = pyqtSignal(bool)  # todos válidos
+
+
+class VerifyRunnable(QRunnable):
+    """Verifica a integridade dos arquivos selecionados fora da thread da interface"""
+    
+    def __init__(self, verify_one, selected_files, fail_fast):
+        super().__init__()
+        self.signals = VerifySignals()
+        self.verify_one = verify_one
+        self.selected_files = selected_files
+        self.fail_fast = fail_fast
+    
+    def run(self):
+        try:
+            if self.fail_fast:
+                # Interrompe no primeiro arquivo inválido
+                all_valid = all(self.verify_one(ft, fp) for ft, fp in self.selected_files)
+            else:
+                # Verifica os arquivos em paralelo (hashlib libera o GIL durante o hash)
+                max_workers = min(len(self.selected_files), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(self.verify_one, *zip(*self.selected_files)))
+                all_valid = all(results)
+        except Exception:
+            all_valid = False
+        self.signals.verification_done.emit(all_valid)
+
+
+class LogSaveSignals(QObject):
+    """Sinais emitidos pela gravação do log em arquivo"""
+    saved = pyqtSignal(str)  # caminho do arquivo
+    save_failed = pyqtSignal(str)  # erro
+
+
+class LogSaveRunnable(QRunnable):
+    """Grava as linhas do log em arquivo fora da thread da interface"""
+    
+    def __init__(self, filename, lines):
+        super().__init__()
+        self.signals = LogSaveSignals()
+        self.filename = filename
+        self.lines = lines
+    
+    def run(self):
+        try:
+            with open(self.filename, 'wb', buffering=1 << 20) as f:
+                for line in self.lines:
+                    f.write(line.encode('utf-8'))
+                    f.write(b"\n")
+            self.signals.saved.emit(self.filename)
+        except Exception as e:
+            self.signals.save_failed.emit(str(e))
+
+
+class TarListingSignals(QObject):
+    """Sinais emitidos pela listagem do conteúdo de um pacote TAR"""
+    entry_found = pyqtSignal(str, str, str, int)  # tipo, entrada, partição, tamanho
+    listing_failed = pyqtSignal(str, str)  # tipo, erro
+
+
+class TarListingRunnable(QRunnable):
+    """Lista as partições de um pacote TAR lendo só os cabeçalhos, entrada por entrada"""
+    
+    def __init__(self, file_type, file_path):
+        super().__init__()
+        self.signals = TarListingSignals()
+        self.file_type = file_type
+        self.file_path = file_path
+    
+    def run(self):
+        try:
+            for partition_name, member in FirmwareParser.iter_tar_members(self.file_path):
+                self.signals.entry_found.emit(self.file_type, member.name, partition_name, member.size)
+        except Exception as e:
+            self.signals.listing_failed.emit(self.file_type, str(e))
+
+
+# Estilos dos painéis e abas da janela, selecionados pelo objectName de cada widget
+_PANEL_QSS = """
+    QFrame#headerFrame {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0.0 #667eea, stop:1 #764ba2);
+        border-radius: 20px;
+        margin-bottom: 15px;
+    }
+    QLabel#headerLogo {
+        font-size: 42px;
+        font-weight: bold;
+        color: white;
+        margin: 15px;
+    }
+    QLabel#headerSubtitle {
+        font-size: 18px;
+        color: rgba(255, 255, 255, 0.9);
+        margin-bottom: 15px;
+    }
+    QLabel#headerTagline {
+        font-size: 14px;
+        color: rgba(255, 255, 255, 0.7);
+        font-style: italic;
+    }
+    QListWidget#devicesList {
+        border: 1px solid #ccc;
+        border-radius: 8px;
+        background-color: #ffffff;
+        font-size: 13px;
+        padding: 5px;
+    }
+    QListWidget#devicesList::item {
+        padding: 8px;
+        border-radius: 4px;
+        margin: 2px;
+    }
+    QListWidget#devicesList::item:selected {
+        background-color: #6c5ce7;
+        color: white;
+    }
+    QCheckBox#quickOption {
+        font-size: 14px;
+        padding: 5px;
+    }
+    QPlainTextEdit#logView {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #2d3436, stop:1 #636e72);
+        color: #00ff88;
+        border: none;
+        border-radius: 12px;
+        font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+        font-size: 12px;
+        padding: 15px;
+        line-height: 1.4;
+    }
+    QTabWidget#mainTabs::pane {
+        border: 3px solid #6c5ce7;
+        border-radius: 15px;
+        background-color: white;
+        margin-top: 10px;
+    }
+    QTabWidget#mainTabs QTabBar::tab {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #f8f9fa, stop:1 #e9ecef);
+        border: 2px solid #ddd;
+        padding: 15px 25px;
+        margin-right: 3px;
+        border-top-left-radius: 12px;
+        border-top-right-radius: 12px;
+        font-weight: bold;
+        font-size: 14px;
+        min-width: 120px;
+    }
+    QTabWidget#mainTabs QTabBar::tab:selected {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #6c5ce7, stop:1 #5f3dc4);
+        color: white;
+        border-bottom-color: #6c5ce7;
+    }
+    QTabWidget#mainTabs QTabBar::tab:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0.0 #a29bfe, stop:1 #6c5ce7);
+        color: white;
+    }
+    QProgressBar#flashProgress {
+        border: none;
+        border-radius: 15px;
+        text-align: center;
+        font-weight: bold;
+        font-size: 14px;
+        background-color: #ecf0f1;
+        height: 30px;
+        color: white;
+    }
+    QProgressBar#flashProgress::chunk {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0.0 #6c5ce7, stop:0.5 #a29bfe, stop:1 #fd79a8);
+        border-radius: 13px;
+        margin: 2px;
+    }
+    QLabel#progressDetails {
+        font-size: 14px;
+        color: #636e72;
+        margin: 10px;
+    }
+    QLabel#tabPlaceholder {
+        font-size: 24px;
+        color: #636e72;
+        margin: 50px;
+        padding: 50px;
+        border: 3px dashed #ddd;
+        border-radius: 20px;
+    }
+    QCheckBox#settingsOption {
+        font-size: 14px;
+        padding: 8px;
+    }
+    QLabel#lastCheckLabel {
+        font-size: 13px;
+        color: #636e72;
+        padding: 10px;
+        background-color: #f8f9fa;
+        border-radius: 8px;
+        margin-top: 10px;
+    }
+    QFrame#aboutTitleFrame {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0.0 #667eea, stop:0.5 #764ba2, stop:1 #f093fb);
+        border-radius: 20px;
+        margin: 20px;
+    }
+    QLabel#aboutTitle {
+        font-size: 48px;
+        font-weight: bold;
+        color: white;
+        margin: 20px;
+    }
+    QLabel#aboutVersion {
+        font-size: 20px;
+        color: rgba(255, 255, 255, 0.9);
+        margin-bottom: 20px;
+    }
+    QLabel#aboutDescription {
+        padding: 30px;
+        background-color: white;
+        border-radius: 15px;
+        border: 2px solid #e9ecef;
+    }
+"""
+
+# Stylesheet único da aplicação (ver apply_modern_style): tema seguido das regras
+# por objectName, que vêm depois para prevalecer sobre as regras genéricas do tema
+_WIDGETS_QSS = (_BUTTON_QSS + _FILE_ROW_QSS + _DEVICE_STATUS_QSS
+                + _SETTINGS_INPUT_QSS + _PANEL_QSS)
+_APP_STYLE_DARK = _MAIN_STYLE_DARK + _WIDGETS_QSS
+_APP_STYLE_LIGHT = _MAIN_STYLE_LIGHT + _WIDGETS_QSS
+
+
+class ZodinFlashTool(QMainWindow):
+    """Classe principal do Zodin Flash Tool"""
+    
+    # Emitido (de qualquer thread) quando o log recebe linhas após um descarregamento
+    log_pending = pyqtSignal()
+    # Emitido (de qualquer thread) quando chega progresso após uma atualização da barra
+    progress_pending = pyqtSignal()
+    
+    def __init__(self):
+        super().__init__()
+        self.files = {}
+        self.checkboxes = {}
+        self._active_files: Tuple[str, ...] = ()
+        # Pasta do último arquivo escolhido, onde o próximo diálogo abre
+        self._last_dir = ""
+        self.is_flashing = False
+        self.device_thread = None
+        self.flash_runnable = None
+        self.connected_devices = []
+        self.current_device = None
+        self._info_box = None
+        self._confirm_box = None
+        self._info_runnable = None
+        self._tar_listing = None
+        self._verify_runnable = None
+        self._log_save_runnable = None
+        self._connect_runnable = None
+        self._info_progress = None
+        
+        # Buffer de log descarregado no máximo a cada 100 ms (evita relayout por linha)
+        self._log_buf: collections.deque = collections.deque(maxlen=_LOG_BUFFER_MAX)
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
+        # Carimbo de hora do último segundo formatado (segundo, texto)
+        self._log_stamp: Tuple[int, str] = (-1, "")
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+        self.log_pending.connect(self._log_timer.start)
+        
+        # Progresso do flash: guarda só o último valor e repinta no máximo a cada 33 ms
+        self._latest_progress: Optional[FlashProgress] = None
+        self._progress_lock = threading.Lock()
+        self._progress_flush_scheduled = False
+        # Último percentual e texto mostrados (evita repassar valores repetidos)
+        self._last_pct: Optional[int] = None
+        self._last_details: Optional[str] = None
+        self._pending_devices = None
+        self._last_device_key: Tuple[str, ...] = ()
+        self._device_state: Optional[bool] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self.progress_pending.connect(self._progress_timer.start)
+        
+        # Cache de verificações de integridade: (caminho, mtime, tamanho, mtime do checksum) -> válido
+        self._integrity_cache_file = Path.home() / ".cache" / "zodin-flash-tool" / "integrity.json"
+        self._integrity_cache: Dict[Tuple[str, int, int, int], bool] = self._load_integrity_cache()
+        self._integrity_cache_dirty = False
+        # Protege o cache, gravado pelas verificações no pool e lido pela interface
+        self._integrity_lock = threading.Lock()
+
+        # Inicializa o tradutor
+        self.translator = QTranslator()
+        self.current_language = QLocale().name().split("_")[0] # Detecta o idioma do sistema
+        self.switch_language(self.current_language)
+        
+        # Inicializa engine própria
+        self.flash_engine = ZodinFlashEngine(
+            progress_callback=self._queue_flash_progress,
+            log_callback=self.log
+        )
+        
+        # Inicializa sistema de atualização
+        if ZodinUpdater:
+            self.updater = ZodinUpdater(self, "1.1.0")
+        else:
+            self.updater = None
+        
+        self._settings_palette = self._build_settings_palette()
+        
+        self.init_ui()
+        self.setup_device_detection()
+        self.setup_animations()
+        
+        # Verifica atualizações após 3 segundos (para não atrasar a inicialização)
+        if self.updater:
+            QTimer.singleShot(3000, self.updater.check_for_updates)
+    
+    def init_ui(self):
+        """Inicializa a interface do usuário"""
+        self.setWindowTitle("Zodin Flash Tool v1.0.0 - The Ultimate Samsung Flash Tool")
+        self.resize(1600, 1000) # Tamanho inicial da janela
+        self.setMinimumSize(1200, 800) # Tamanho mínimo para responsividade
+        
+        # Aplica o estilo antes de criar os widgets, que já nascem polidos com ele
+        self.apply_modern_style(dark_mode=False)
+        
+        # Widget central
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # Layout principal
+        main_layout = QHBoxLayout(central_widget)
+        main_layout.setSpacing(25)
+        main_layout.setContentsMargins(25, 25, 25, 25)
+        
+        # Splitter para dividir a interface
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        main_layout.addWidget(splitter)
+        
+        # Painel esquerdo
+        left_panel = self.create_left_panel()
+        splitter.addWidget(left_panel)
+        
+        # Painel direito
+        right_panel = self.create_right_panel()
+        splitter.addWidget(right_panel)
+        
+        # Proporções do splitter
+        splitter.setSizes([500, 1100])
+        
+        # Adiciona um menu para alternar o modo escuro
+        menu_bar = self.menuBar()
+        view_menu = menu_bar.addMenu("Visualização")
+        dark_mode_action = view_menu.addAction("Modo Escuro")
+        dark_mode_action.setCheckable(True)
+        dark_mode_action.toggled.connect(self.toggle_dark_mode)
+
+        # Adiciona um menu para trocar o idioma
+        lang_menu = menu_bar.addMenu("Idioma")
+        en_action = lang_menu.addAction("English")
+        en_action.triggered.connect(lambda *_: self.switch_language("en"))
+        pt_action = lang_menu.addAction("Português")
+        pt_action.triggered.connect(lambda *_: self.switch_language("pt"))
+
+    def _build_settings_palette(self):
+        """Cria a paleta usada pelos campos da aba de configurações"""
+        palette = QPalette(self.palette())
+        palette.setColor(QPalette.ColorRole.Base, QColor("#ffffff"))
+        palette.setColor(QPalette.ColorRole.Button, QColor("#f8f9fa"))
+        palette.setColor(QPalette.ColorRole.WindowText, QColor("#2d3436"))
+        palette.setColor(QPalette.ColorRole.Text, QColor("#2d3436"))
+        palette.setColor(QPalette.ColorRole.Highlight, QColor("#6c5ce7"))
+        return palette
+    
+    def _style_settings_input(self, widget, min_width):
+        """Aplica paleta e estilo estrutural a um campo da aba de configurações"""
+        widget.setPalette(self._settings_palette)
+        widget.setObjectName("settingsInput")
+        widget.setMinimumWidth(min_width)
+    
+    def toggle_dark_mode(self, checked):
+        self.apply_modern_style(dark_mode=checked)
+
+    def switch_language(self, lang_code):
+        if lang_code == "en":
+            self.translator.load("en", ".")
+        elif lang_code == "pt":
+            self.translator.load("pt", ".")
+        QApplication.instance().installTranslator(self.translator)
+        self.retranslateUi()
+
+    def retranslateUi(self):
+        # TODO: Implementar a re-tradução de todos os elementos da UI
+        self.setWindowTitle(self.tr("Zodin Flash Tool - The Ultimate Samsung Flash Tool"))
+        # Exemplo: self.device_status.setText(self.tr("Searching for devices..."))
+        # Isso precisará ser feito para todos os textos visíveis na UI
+
+
+    
+    def create_left_panel(self):
+        """Cria o painel esquerdo com design moderno"""
+        left_widget = QWidget()
+        left_layout = QVBoxLayout(left_widget)
+        left_layout.setSpacing(20)
+        
+        # Header com logo animado
+        header_frame = QFrame()
+        header_frame.setObjectName("headerFrame")
+        header_layout = QVBoxLayout(header_frame)
+        header_layout.setContentsMargins(30, 30, 30, 30)
+        
+        # Logo animado
+        logo_label = GlowingLabel("ZODIN")
+        logo_label.setObjectName("headerLogo")
+        logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        header_layout.addWidget(logo_label)
+        
+        subtitle_label = QLabel("Flash Tool v1.0.0")
+        subtitle_label.setObjectName("headerSubtitle")
+        subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        header_layout.addWidget(subtitle_label)
+        
+        tagline_label = QLabel("The Ultimate Samsung Flash Tool")
+        tagline_label.setObjectName("headerTagline")
+        tagline_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        header_layout.addWidget(tagline_label)
+        
+        left_layout.addWidget(header_frame)
+        
+        # Status do dispositivo com animações
+        device_group = QGroupBox("🔌 Status do Dispositivo")
+        device_layout = QVBoxLayout(device_group)
+        
+        self.device_status = DeviceStatusLabel("🔍 Procurando dispositivos...")
+        self.device_status.setObjectName("deviceStatus")
+        device_layout.addWidget(self.device_status)
+        
+        # Lista de dispositivos
+        self.devices_list = QListWidget()
+        self.devices_list.setMaximumHeight(120)
+        self.devices_list.setObjectName("devicesList")
+        device_layout.addWidget(self.devices_list)
+        
+        # Botão de refresh
+        refresh_btn = AnimatedButton("🔄 Atualizar Dispositivos")
+        refresh_btn.clicked.connect(self.refresh_devices)
+        device_layout.addWidget(refresh_btn)
+        
+        left_layout.addWidget(device_group)
+        
+        # Configurações rápidas
+        settings_group = QGroupBox("⚙️ Configurações Rápidas")
+        settings_layout = QVBoxLayout(settings_group)
+        
+        self.auto_reboot_cb = QCheckBox("🔄 Auto Reboot")
+        self.auto_reboot_cb.setChecked(True)
+        self.auto_reboot_cb.setObjectName("quickOption")
+        
+        self.verify_files_cb = QCheckBox("✅ Verificar Integridade")
+        self.verify_files_cb.setChecked(True)
+        self.verify_files_cb.setObjectName("quickOption")
+        
+        self.fail_fast_cb = QCheckBox("⏹️ Parar na Primeira Falha")
+        self.fail_fast_cb.setObjectName("quickOption")
+        
+        self.backup_before_flash_cb = QCheckBox("💾 Backup Antes do Flash")
+        self.backup_before_flash_cb.setObjectName("quickOption")
+        
+        settings_layout.addWidget(self.auto_reboot_cb)
+        settings_layout.addWidget(self.verify_files_cb)
+        settings_layout.addWidget(self.fail_fast_cb)
+        settings_layout.addWidget(self.backup_before_flash_cb)
+        
+        left_layout.addWidget(settings_group)
+        
+        # Log com design moderno
+        log_group = QGroupBox("📋 Log de Atividades")
+        log_layout = QVBoxLayout(log_group)
+        
+        self.log_text = QPlainTextEdit()
+        self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(_LOG_MAX_BLOCKS)
+        self._log_cursor = QTextCursor(self.log_text.document())
+        self.log_text.setObjectName("logView")
+        log_layout.addWidget(self.log_text)
+        
+        # Botões do log
+        log_buttons_layout = QHBoxLayout()
+        clear_log_btn = AnimatedButton("🧹 Limpar")
+        clear_log_btn.clicked.connect(self.clear_log)
+        save_log_btn = AnimatedButton("💾 Salvar")
+        save_log_btn.clicked.connect(self.save_log)
+        
+        log_buttons_layout.addWidget(clear_log_btn)
+        log_buttons_layout.addWidget(save_log_btn)
+        log_layout.addLayout(log_buttons_layout)
+        
+        left_layout.addWidget(log_group)
+        
+        return left_widget
+    
+    def create_right_panel(self):
+        """Cria o painel direito com abas modernas"""
+        tab_widget = QTabWidget()
+        tab_widget.setObjectName("mainTabs")
+        
+        # Aba Flash
+        flash_tab = self.create_flash_tab()
+        tab_widget.addTab(flash_tab, "🔥 Flash")
+        
+        # Abas secundárias são montadas só na primeira vez que forem abertas
+        self._tab_factories = {}
+        self._add_lazy_tab(tab_widget, self.create_backup_tab, "💾 Backup")
+        self._add_lazy_tab(tab_widget, self.create_download_tab, "📥 Download")
+        self._add_lazy_tab(tab_widget, self.create_tools_tab, "🔧 Tools")
+        
+        # Aba Configurações (montada já na inicialização: as configurações leem seus campos)
+        settings_tab = self.create_settings_tab()
+        tab_widget.addTab(settings_tab, "⚙️ Config")
+        
+        self._add_lazy_tab(tab_widget, self.create_about_tab, "ℹ️ About")
+        tab_widget.currentChanged.connect(self._build_lazy_tab)
+        tab_widget.currentChanged.connect(self._apply_pending_views)
+        self._tab_widget = tab_widget
+        
+        return tab_widget
+    
+    def _add_lazy_tab(self, tab_widget, factory, title):
+        """Adiciona uma aba vazia cujo conteúdo é criado pela factory quando aberta"""
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        index = tab_widget.addTab(placeholder, title)
+        self._tab_factories[index] = factory
+    
+    def _build_lazy_tab(self, index):
+        """Monta o conteúdo de uma aba na primeira vez que ela é aberta"""
+        factory = self._tab_factories.pop(index, None)
+        if factory is not None:
+            self._tab_widget.widget(index).layout().addWidget(factory())
+    
+    def create_flash_tab(self):
+        """Cria a aba de flash com design moderno"""
+        flash_widget = QWidget()
+        flash_layout = QVBoxLayout(flash_widget)
+        flash_layout.setSpacing(25)
+        
+        # Arquivos de firmware
+        files_group = QGroupBox("📁 Arquivos de Firmware")
+        files_layout = QVBoxLayout(files_group)
+        
+        file_types = [
+            ('BL', 'Bootloader', '🔧'),
+            ('AP', 'Android Platform', '📱'),
+            ('CP', 'Cellular Processor', '📡'),
+            ('CSC', 'Consumer Software Customization', '🌍'),
+            ('USERDATA', 'User Data', '👤')
+        ]
+        
+        for file_type, description, icon in file_types:
+            file_row = self.create_modern_file_row(file_type, description, icon)
+            files_layout.addWidget(file_row)
+        
+        flash_layout.addWidget(files_group)
+        
+        # Progresso com animações
+        progress_group = QGroupBox("📊 Progresso do Flash")
+        progress_layout = QVBoxLayout(progress_group)
+        
+        self.progress_bar = AnimatedProgressBar()
+        self.progress_bar.setVisible(False)
+        progress_layout.addWidget(self.progress_bar)
+        
+        self.progress_details = QLabel("")
+        self.progress_details.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.progress_details.setObjectName("progressDetails")
+        # Largura ignorada no layout: o texto muda a cada quadro sem refazer o layout da aba
+        self.progress_details.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
+        self.progress_details.setVisible(False)
+        progress_layout.addWidget(self.progress_details)
+        
+        flash_layout.addWidget(progress_group)
+        
+        # Botões de ação
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addStretch()
+        
+        self.verify_button = AnimatedButton("🔍 Verificar Arquivos")
+        self.verify_button.clicked.connect(self.verify_files)
+        
+        reset_button = AnimatedButton("🧹 Limpar Tudo")
+        reset_button.clicked.connect(self.reset_form)
+        
+        self.start_button = AnimatedButton("🚀 Iniciar Flash", primary=True)
+        self.start_button.clicked.connect(self.start_flash)
+        
+        buttons_layout.addWidget(self.verify_button)
+        buttons_layout.addWidget(reset_button)
+        buttons_layout.addWidget(self.start_button)
+        
+        flash_layout.addLayout(buttons_layout)
+        flash_layout.addStretch()
+        
+        return flash_widget
+    
+    def create_modern_file_row(self, file_type, description, icon):
+        """Cria uma linha moderna para seleção de arquivo"""
+        row_frame = QFrame()
+        row_frame.setObjectName("fileRow")
+        
+        row_layout = QHBoxLayout(row_frame)
+        row_layout.setContentsMargins(15, 15, 15, 15)
+        
+        # Checkbox com ícone
+        checkbox_layout = QVBoxLayout()
+        checkbox = QCheckBox()
+        checkbox.setObjectName("fileRowCheck")
+        self.checkboxes[file_type] = checkbox
+        checkbox.toggled.connect(functools.partial(self._on_slot_toggled, file_type))
+        
+        icon_label = QLabel(icon)
+        icon_label.setObjectName("fileRowIcon")
+        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        checkbox_layout.addWidget(checkbox)
+        checkbox_layout.addWidget(icon_label)
+        row_layout.addLayout(checkbox_layout)
+        
+        # Informações do arquivo
+        info_layout = QVBoxLayout()
+        
+        type_label = QLabel(f"{file_type}")
+        type_label.setObjectName("fileRowType")
+        
+        desc_label = QLabel(description)
+        desc_label.setObjectName("fileRowDesc")
+        
+        file_edit = QLineEdit()
+        file_edit.setReadOnly(True)
+        file_edit.setPlaceholderText(f"Selecione o arquivo {file_type}...")
+        file_edit.setObjectName("fileRowPath")
+        self.files[file_type] = file_edit
+        
+        info_layout.addWidget(type_label)
+        info_layout.addWidget(desc_label)
+        info_layout.addWidget(file_edit)
+        row_layout.addLayout(info_layout)
+        
+        # Botões
+        buttons_layout = QVBoxLayout()
+        
+        browse_button = AnimatedButton("📁")
+        browse_button.setMaximumWidth(60)
+        browse_button.clicked.connect(functools.partial(self.browse_file, file_type))
+        
+        info_button = AnimatedButton("ℹ️")
+        info_button.setMaximumWidth(60)
+        info_button.clicked.connect(functools.partial(self.show_file_info, file_type))
+        
+        buttons_layout.addWidget(browse_button)
+        buttons_layout.addWidget(info_button)
+        row_layout.addLayout(buttons_layout)
+        
+        return row_frame
+    
+    def create_backup_tab(self):
+        """Cria a aba de backup"""
+        backup_widget = QWidget()
+        backup_layout = QVBoxLayout(backup_widget)
+        
+        # Placeholder para funcionalidades de backup
+        placeholder = QLabel("🚧 Funcionalidades de Backup em Desenvolvimento 🚧")
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        placeholder.setObjectName("tabPlaceholder")
+        backup_layout.addWidget(placeholder)
+        
+        return backup_widget
+    
+    def create_download_tab(self):
+        """Cria a aba de download"""
+        download_widget = QWidget()
+        download_layout = QVBoxLayout(download_widget)
+        
+        # Placeholder para funcionalidades de download
+        placeholder = QLabel("🚧 Funcionalidades de Download em Desenvolvimento 🚧")
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        placeholder.setObjectName("tabPlaceholder")
+        download_layout.addWidget(placeholder)
+        
+        return download_widget
+    
+    def create_settings_tab(self):
+        """Cria a aba de configurações"""
+        settings_widget = QWidget()
+        settings_layout = QVBoxLayout(settings_widget)
+        settings_layout.setSpacing(25)
+        
+        # Configurações de Atualização
+        update_group = QGroupBox("🔄 Sistema de Atualização")
+        update_layout = QVBoxLayout(update_group)
+        
+        # Obter configurações atuais
+        update_config = self.updater.get_update_settings()
+        
+        # Auto verificação
+        self.auto_check_cb = QCheckBox("🔍 Verificar atualizações automaticamente")
+        self.auto_check_cb.setChecked(update_config.get("auto_check", True))
+        self.auto_check_cb.setObjectName("settingsOption")
+        update_layout.addWidget(self.auto_check_cb)
+        
+        # Intervalo de verificação
+        interval_layout = QHBoxLayout()
+        interval_layout.addWidget(QLabel("⏰ Verificar a cada:"))
+        
+        self.check_interval_spin = QSpinBox()
+        self.check_interval_spin.setRange(1, 168)  # 1 hora a 1 semana
+        self.check_interval_spin.setValue(update_config.get("check_interval", 24))
+        self.check_interval_spin.setSuffix(" horas")
+        self._style_settings_input(self.check_interval_spin, 100)
+        interval_layout.addWidget(self.check_interval_spin)
+        interval_layout.addStretch()
+        update_layout.addLayout(interval_layout)
+        
+        # Apenas atualizações críticas
+        self.critical_only_cb = QCheckBox("⚠️ Notificar apenas atualizações críticas")
+        self.critical_only_cb.setChecked(update_config.get("notify_critical_only", False))
+        self.critical_only_cb.setObjectName("settingsOption")
+        update_layout.addWidget(self.critical_only_cb)
+        
+        # Botões de ação
+        update_buttons_layout = QHBoxLayout()
+        
+        check_now_btn = AnimatedButton("🔍 Verificar Agora", primary=True)
+        check_now_btn.clicked.connect(self.check_updates_manually)
+        
+        save_settings_btn = AnimatedButton("💾 Salvar Configurações", success=True)
+        save_settings_btn.clicked.connect(self.save_update_settings)
+        
+        reset_skipped_btn = AnimatedButton("🔄 Resetar Versões Puladas")
+        reset_skipped_btn.clicked.connect(self.reset_skipped_versions)
+        
+        update_buttons_layout.addWidget(check_now_btn)
+        update_buttons_layout.addWidget(save_settings_btn)
+        update_buttons_layout.addWidget(reset_skipped_btn)
+        update_layout.addLayout(update_buttons_layout)
+        
+        # Informações da última verificação
+        last_check = update_config.get("last_check")
+        if last_check:
+            try:
+                from datetime import datetime
+                last_check_date = datetime.fromisoformat(last_check)
+                last_check_str = last_check_date.strftime("%d/%m/%Y às %H:%M")
+            except:
+                last_check_str = "Data inválida"
+        else:
+            last_check_str = "Nunca"
+        
+        last_check_label = QLabel(f"📅 Última verificação: {last_check_str}")
+        last_check_label.setObjectName("lastCheckLabel")
+        update_layout.addWidget(last_check_label)
+        
+        settings_layout.addWidget(update_group)
+        
+        # Configurações da Interface
+        interface_group = QGroupBox("🎨 Interface e Aparência")
+        interface_layout = QVBoxLayout(interface_group)
+        
+        # Animações
+        self.animations_cb = QCheckBox("✨ Ativar animações fluidas")
+        self.animations_cb.setChecked(True)
+        self.animations_cb.setObjectName("settingsOption")
+        interface_layout.addWidget(self.animations_cb)
+        
+        # Tema
+        theme_layout = QHBoxLayout()
+        theme_layout.addWidget(QLabel("🎨 Tema:"))
+        
+        self.theme_combo = QComboBox()
+        self.theme_combo.addItems(["🌟 Automático", "☀️ Claro", "🌙 Escuro"])
+        self._style_settings_input(self.theme_combo, 150)
+        theme_layout.addWidget(self.theme_combo)
+        theme_layout.addStretch()
+        interface_layout.addLayout(theme_layout)
+        
+        # Idioma
+        language_layout = QHBoxLayout()
+        language_layout.addWidget(QLabel("🌍 Idioma:"))
+        
+        self.language_combo = QComboBox()
+        self.language_combo.addItems(["🇧🇷 Português", "🇺🇸 English"])
+        self._style_settings_input(self.language_combo, 150)
+        language_layout.addWidget(self.language_combo)
+        language_layout.addStretch()
+        interface_layout.addLayout(language_layout)
+        
+        settings_layout.addWidget(interface_group)
+        
+        # Configurações Avançadas
+        advanced_group = QGroupBox("🔧 Configurações Avançadas")
+        advanced_layout = QVBoxLayout(advanced_group)
+        
+        # Debug mode
+        self.debug_mode_cb = QCheckBox("🐛 Modo Debug (logs detalhados)")
+        self.debug_mode_cb.setObjectName("settingsOption")
+        advanced_layout.addWidget(self.debug_mode_cb)
+        
+        # Timeout USB
+        timeout_layout = QHBoxLayout()
+        timeout_layout.addWidget(QLabel("⏱️ Timeout USB:"))
+        
+        self.usb_timeout_spin = QSpinBox()
+        self.usb_timeout_spin.setRange(1000, 30000)
+        self.usb_timeout_spin.setValue(5000)
+        self.usb_timeout_spin.setSuffix(" ms")
+        self._style_settings_input(self.usb_timeout_spin, 100)
+        timeout_layout.addWidget(self.usb_timeout_spin)
+        timeout_layout.addStretch()
+        advanced_layout.addLayout(timeout_layout)
+        
+        # Chunk size
+        chunk_layout = QHBoxLayout()
+        chunk_layout.addWidget(QLabel("📦 Tamanho do Chunk:"))
+        
+        self.chunk_size_combo = QComboBox()
+        self.chunk_size_combo.addItems([
+            "512 KB", "1 MB", "2 MB", "4 MB", "8 MB"
+        ])
+        self.chunk_size_combo.setCurrentText("1 MB")
+        self._style_settings_input(self.chunk_size_combo, 100)
+        chunk_layout.addWidget(self.chunk_size_combo)
+        chunk_layout.addStretch()
+        advanced_layout.addLayout(chunk_layout)
+        
+        settings_layout.addWidget(advanced_group)
+        
+        # Botões gerais
+        general_buttons_layout = QHBoxLayout()
+        general_buttons_layout.addStretch()
+        
+        reset_all_btn = AnimatedButton("🔄 Restaurar Padrões", danger=True)
+        reset_all_btn.clicked.connect(self.reset_all_settings)
+        
+        apply_btn = AnimatedButton("✅ Aplicar Todas", primary=True)
+        apply_btn.clicked.connect(self.apply_all_settings)
+        
+        general_buttons_layout.addWidget(reset_all_btn)
+        general_buttons_layout.addWidget(apply_btn)
+        
+        settings_layout.addLayout(general_buttons_layout)
+        settings_layout.addStretch()
+        
+        return settings_widget
+    
+    def _load_integrity_cache(self):
+        """Carrega o cache de verificações de integridade salvo em disco"""
+        try:
+            with open(self._integrity_cache_file, 'rb') as f:
+                data = f.read()
+            entries = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            return {tuple(entry[:4]): bool(entry[4]) for entry in entries}
+        except Exception:
+            return {}
+    
+    def _save_integrity_cache(self):
+        """Salva em disco o cache de verificações, se houve mudanças"""
+        with self._integrity_lock:
+            if not self._integrity_cache_dirty:
+                return
+            # Mantém apenas as entradas mais recentes
+            entries = [[*key, valid] for key, valid in self._integrity_cache.items()][-64:]
+            self._integrity_cache_dirty = False
+        
+        try:
+            self._integrity_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            data = orjson.dumps(entries) if ORJSON_AVAILABLE else json.dumps(entries).encode()
+            with open(self._integrity_cache_file, 'wb') as f:
+                f.write(data)
+        except Exception:
+            # Tenta de novo no próximo salvamento
+            with self._integrity_lock:
+                self._integrity_cache_dirty = True
+    
+    def _integrity_key(self, file_path, file_stat):
+        """Chave do cache de integridade para o estado atual do arquivo"""
+        checksum_mtime = 0
+        for extension, _ in CHECKSUM_SIDECARS:
+            try:
+                checksum_mtime = max(checksum_mtime, os.stat(file_path + extension).st_mtime_ns)
+            except OSError:
+                pass
+        return (os.path.realpath(file_path), file_stat.st_mtime_ns, file_stat.st_size, checksum_mtime)
+    
+    def _known_integrity(self, file_paths):
+        """Resultados em cache (caminho -> válido) dos arquivos ainda inalterados"""
+        known = {}
+        for file_path in file_paths:
+            try:
+                key = self._integrity_key(file_path, os.stat(file_path))
+            except OSError:
+                continue
+            with self._integrity_lock:
+                valid = self._integrity_cache.get(key)
+            if valid is not None:
+                known[file_path] = valid
+        return known
+    
+    def _verify_cached(self, file_path, file_stat=None):
+        """Verifica a integridade reaproveitando o resultado de arquivos inalterados"""
+        if file_stat is None:
+            file_stat = os.stat(file_path)
+        
+        key = self._integrity_key(file_path, file_stat)
+        with self._integrity_lock:
+            valid = self._integrity_cache.get(key)
+        if valid is None:
+            valid = FirmwareParser.verify_firmware_integrity(file_path, file_stat)
+            with self._integrity_lock:
+                self._integrity_cache[key] = valid
+                self._integrity_cache_dirty = True
+        
+        return valid
+    
+    def show_info(self, title, text):
+        """Exibe uma notificação reutilizando a mesma caixa de mensagem"""
+        if self._info_box is None:
+            self._info_box = QMessageBox(QMessageBox.Icon.Information, "", "", parent=self)
+        self._info_box.setWindowTitle(title)
+        self._info_box.setText(text)
+        self._info_box.exec()
+    
+    def ask_confirmation(self, title, text):
+        """Pergunta Sim/Não reutilizando a mesma caixa de mensagem"""
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(
+                QMessageBox.Icon.Question, "", "",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                parent=self
+            )
+        self._confirm_box.setWindowTitle(title)
+        self._confirm_box.setText(text)
+        self._confirm_box.setDefaultButton(QMessageBox.StandardButton.No)
+        return self._confirm_box.exec() == QMessageBox.StandardButton.Yes
+    
+    @pyqtSlot()
+    def check_updates_manually(self):
+        """Verifica atualizações manualmente"""
+        self.log("🔍 Verificando atualizações manualmente...")
+        self.updater.manual_check()
+    
+    @pyqtSlot()
+    def save_update_settings(self):
+        """Salva configurações de atualização"""
+        settings = {
+            "auto_check": self.auto_check_cb.isChecked(),
+            "check_interval": self.check_interval_spin.value(),
+            "notify_critical_only": self.critical_only_cb.isChecked()
+        }
+        
+        self.updater.update_settings(settings)
+        self.log("💾 Configurações de atualização salvas")
+        
+        self.show_info(
+            "Configurações Salvas",
+            "✅ Configurações de atualização salvas com sucesso!"
+        )
+    
+    @pyqtSlot()
+    def reset_skipped_versions(self):
+        """Reseta versões puladas"""
+        settings = self.updater.get_update_settings()
+        settings["skipped_versions"] = []
+        self.updater.update_settings(settings)
+        
+        self.log("🔄 Lista de versões puladas foi resetada")
+        self.show_info(
+            "Versões Resetadas",
+            "🔄 Lista de versões puladas foi resetada.\n"
+            "Você será notificado sobre todas as atualizações novamente."
+        )
+    
+    @pyqtSlot()
+    def reset_all_settings(self):
+        """Restaura todas as configurações para o padrão"""
+        confirmed = self.ask_confirmation(
+            "Restaurar Configurações",
+            "⚠️ Tem certeza que deseja restaurar todas as configurações para o padrão?\n\n"
+            "Esta ação não pode ser desfeita."
+        )
+        
+        if confirmed:
+            # Restaura configurações de atualização
+            default_update_settings = {
+                "auto_check": True,
+                "check_interval": 24,
+                "notify_critical_only": False,
+                "skipped_versions": []
+            }
+            self.updater.update_settings(default_update_settings)
+            
+            # Restaura controles da interface
+            self.auto_check_cb.setChecked(True)
+            self.check_interval_spin.setValue(24)
+            self.critical_only_cb.setChecked(False)
+            self.animations_cb.setChecked(True)
+            self.theme_combo.setCurrentIndex(0)
+            self.language_combo.setCurrentIndex(0)
+            self.debug_mode_cb.setChecked(False)
+            self.usb_timeout_spin.setValue(5000)
+            self.chunk_size_combo.setCurrentText("1 MB")
+            
+            self.log("🔄 Todas as configurações foram restauradas para o padrão")
+            self.show_info(
+                "Configurações Restauradas",
+                "✅ Todas as configurações foram restauradas para o padrão!"
+            )
+    
+    @pyqtSlot()
+    def apply_all_settings(self):
+        """Aplica todas as configurações"""
+        # Salva configurações de atualização
+        self.save_update_settings()
+        
+        # Aplica outras configurações
+        self.log("✅ Todas as configurações foram aplicadas")
+        self.show_info(
+            "Configurações Aplicadas",
+            "✅ Todas as configurações foram aplicadas com sucesso!\n\n"
+            "Algumas mudanças podem exigir reinicialização da aplicação."
+        )
+    
+    def create_tools_tab(self):
+        """Cria a aba de ferramentas"""
+        tools_widget = QWidget()
+        tools_layout = QVBoxLayout(tools_widget)
+        
+        # Placeholder para ferramentas
+        placeholder = QLabel("🚧 Ferramentas Avançadas em Desenvolvimento 🚧")
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        placeholder.setObjectName("tabPlaceholder")
+        tools_layout.addWidget(placeholder)
+        
+        return tools_widget
+    
+    def create_about_tab(self):
+        """Cria a aba sobre"""
+        about_widget = QWidget()
+        about_layout = QVBoxLayout(about_widget)
+        
+        # Título com animação
+        title_frame = QFrame()
+        title_frame.setObjectName("aboutTitleFrame")
+        title_layout = QVBoxLayout(title_frame)
+        title_layout.setContentsMargins(40, 40, 40, 40)
+        
+        app_title = GlowingLabel("ZODIN FLASH TOOL")
+        app_title.setObjectName("aboutTitle")
+        app_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_layout.addWidget(app_title)
+        
+        version_label = QLabel("Version 1.0.0 - The Ultimate Samsung Flash Tool")
+        version_label.setObjectName("aboutVersion")
+        version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_layout.addWidget(version_label)
+        
+        about_layout.addWidget(title_frame)
+        
+        # Descrição
+        description = QLabel(_ABOUT_HTML)
+        description.setWordWrap(True)
+        description.setObjectName("aboutDescription")
+        about_layout.addWidget(description)
+        
+        about_layout.addStretch()
+        
+        return about_widget
+
+    def apply_modern_style(self, dark_mode=False):
+        """Aplica um estilo moderno e limpo à aplicação"""
+        _set_stylesheet(QApplication.instance(), _APP_STYLE_DARK if dark_mode else _APP_STYLE_LIGHT)
+    
+    def setup_device_detection(self):
+        """Configura a detecção de dispositivos"""
+        self.device_thread = DeviceDetectionThread(self.flash_engine)
+        self.device_thread.device_detected.connect(self.update_device_status)
+        self.device_thread.start()
+    
+    def setup_animations(self):
+        """Configura animações da interface"""
+        if not self.animations_cb.isChecked():
+            return
+        
+        # Animação de entrada: opacidade do widget central em vez da janela,
+        # evitando recompor a janela inteira no compositor a cada quadro
+        central_widget = self.centralWidget()
+        opacity_effect = QGraphicsOpacityEffect(central_widget)
+        central_widget.setGraphicsEffect(opacity_effect)
+        
+        self.fade_animation = QPropertyAnimation(opacity_effect, b"opacity", self)
+        self.fade_animation.setDuration(400)
+        self.fade_animation.setStartValue(0.0)
+        self.fade_animation.setEndValue(1.0)
+        self.fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        # Remove o efeito ao final para não renderizar tudo fora da tela
+        self.fade_animation.finished.connect(lambda: central_widget.setGraphicsEffect(None))
+        self.fade_animation.start()
+    
+    def update_device_status(self, devices: List[SamsungDevice], any_connected: bool) -> None:
+        """Atualiza o status dos dispositivos com animações"""
+        self.connected_devices = devices
+        self.start_button.setEnabled(any_connected)
+        
+        if any_connected:
+            self._connect_first_device()
+        else:
+            self.current_device = None
+        
+        # Com a janela fora da tela, só a última lista é guardada para quando voltar
+        if self._view_hidden(self.devices_list):
+            self._pending_devices = (devices, any_connected)
+        else:
+            self._pending_devices = None
+            self._apply_device_view(devices, any_connected)
+    
+    def _connect_first_device(self) -> None:
+        """Conecta ao primeiro dispositivo detectado, se nenhum estiver conectado"""
+        devices = self.connected_devices
+        if not devices or self.current_device or self._connect_runnable is not None:
+            return
+        if devices[0].mode == SamsungMode.ADB:
+            self._on_device_connected(devices[0], True)
+            return
+        runnable = ConnectRunnable(self.flash_engine, devices[0])
+        runnable.signals.connected.connect(self._on_device_connected)
+        self._connect_runnable = runnable
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_device_connected(self, device: SamsungDevice, ok: bool) -> None:
+        """Adota o dispositivo conectado, se ele ainda for o primeiro da lista"""
+        self._connect_runnable = None
+        if self.current_device:
+            return
+        
+        devices = self.connected_devices
+        if not devices or (devices[0].serial_number, devices[0].mode) != (device.serial_number, device.mode):
+            # A lista mudou durante o handshake: conecta ao primeiro dispositivo atual
+            self._connect_first_device()
+            return
+        
+        name = f"{device.model or 'Samsung Device'} ({device.mode.value.capitalize()})"
+        if ok:
+            self.current_device = device
+            self.log(f"🔗 Conectado ao dispositivo: {name}")
+        else:
+            self.log(f"❌ Falha ao conectar ao dispositivo: {name}")
+    
+    def _apply_device_view(self, devices: List[SamsungDevice], any_connected: bool) -> None:
+        """Mostra o status e a lista de dispositivos"""
+        # O status só é reescrito quando muda entre "detectado" e "procurando"
+        state_changed = any_connected != self._device_state
+        self._device_state = any_connected
+        
+        if any_connected:
+            if state_changed:
+                self.device_status.setText("✅ Dispositivo Samsung Detectado!")
+                self.device_status.set_connected(True)
+
+            items = []
+            for device in devices:
+                if device.mode == SamsungMode.ADB:
+                    items.append(f"📱 {device.model or 'Dispositivo Android'} ({device.serial_number}) - ADB")
+                else:
+                    items.append(f"📱 {device.model or 'Samsung Device'} ({device.serial_number}) - {device.mode.value.capitalize()}")
+            self._sync_devices_list(items)
+        else:
+            if state_changed:
+                self.device_status.setText("🔍 Procurando dispositivos Samsung...")
+                self.device_status.set_connected(False)
+            
+            # Adiciona mensagem na lista
+            self._sync_devices_list(["🔍 Nenhum dispositivo detectado"])
+    
+    def _view_hidden(self, widget) -> bool:
+        """Indica se o widget está fora da tela (aba inativa, janela oculta ou minimizada)"""
+        return not widget.isVisible() or self.isMinimized()
+    
+    def _apply_pending_views(self, *_) -> None:
+        """Aplica as atualizações adiadas enquanto a interface estava fora da tela"""
+        if self._pending_devices is not None and not self._view_hidden(self.devices_list):
+            devices, any_connected = self._pending_devices
+            self._pending_devices = None
+            self._apply_device_view(devices, any_connected)
+        self._flush_progress()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._apply_pending_views()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        # Ao restaurar a janela minimizada
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            self._apply_pending_views()
+    
+    def _sync_devices_list(self, texts: List[str]) -> None:
+        """Atualiza a lista de dispositivos só nas linhas que mudaram, preservando a seleção"""
+        key = tuple(texts)
+        if key == self._last_device_key:
+            return
+        self._last_device_key = key
+        
+        # Todas as mudanças numa única repintura
+        self.devices_list.setUpdatesEnabled(False)
+        try:
+            count = self.devices_list.count()
+            for row, text in enumerate(texts[:count]):
+                item = self.devices_list.item(row)
+                if item.text() != text:
+                    item.setText(text)
+            
+            if len(texts) > count:
+                self.devices_list.addItems(texts[count:])
+            while self.devices_list.count() > len(texts):
+                self.devices_list.takeItem(self.devices_list.count() - 1)
+        finally:
+            self.devices_list.setUpdatesEnabled(True)
+    
+    def log(self, message: str) -> None:
+        """Adiciona mensagem ao log com timestamp"""
+        now = int(time.time())
+        sec, stamp = self._log_stamp
+        if sec != now:
+            stamp = time.strftime('%H:%M:%S', time.localtime(now))
+            self._log_stamp = (now, stamp)
+        line = f"[{stamp}] {message}"
+        with self._log_lock:
+            self._log_buf.append(line)
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        self.log_pending.emit()
+    
+    def _flush_log(self) -> None:
+        """Descarrega as mensagens pendentes no log de uma só vez"""
+        if not hasattr(self, 'log_text'):
+            self._log_timer.start()
+            return
+        with self._log_lock:
+            lines = list(self._log_buf)
+            self._log_buf.clear()
+            self._log_flush_scheduled = False
+        if not lines:
+            return
+        # Insere o lote no final por um cursor reaproveitado e só acompanha o final
+        # se o usuário já estava nele (não puxa quem rolou para ler o histórico)
+        scroll_bar = self.log_text.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        text = "\n".join(lines)
+        if not self.log_text.document().isEmpty():
+            text = "\n" + text
+        self._log_cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._log_cursor.insertText(text)
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+    
+    def update_flash_progress(self, progress: FlashProgress) -> None:
+        """Atualiza progresso do flash com animações"""
+        if hasattr(self, 'progress_bar'):
+            # Vários callbacks caem no mesmo 1%: só valores novos chegam à barra
+            pct = int(progress.percentage)
+            if pct != self._last_pct:
+                self._last_pct = pct
+                self.progress_bar.setValue(pct)
+            
+            details = f"📁 {progress.current_file} | 📊 {progress.stage}"
+            if progress.total_bytes > 0:
+                mb_current = progress.current_bytes / (1024 * 1024)
+                mb_total = progress.total_bytes / (1024 * 1024)
+                details += f" | 💾 {mb_current:.1f}/{mb_total:.1f} MB"
+            
+            if details != self._last_details:
+                self._last_details = details
+                self.progress_details.setText(details)
+    
+    def _queue_flash_progress(self, progress: FlashProgress) -> None:
+        """Registra o progresso mais recente (pode ser chamado de qualquer thread)"""
+        with self._progress_lock:
+            self._latest_progress = progress
+            if self._progress_flush_scheduled:
+                return
+            self._progress_flush_scheduled = True
+        self.progress_pending.emit()
+    
+    def _flush_progress(self) -> None:
+        """Aplica na interface o último progresso recebido"""
+        # Com a aba de flash fora da tela o valor fica guardado até ela voltar
+        hidden = self._view_hidden(self.progress_bar)
+        with self._progress_lock:
+            self._progress_flush_scheduled = False
+            progress = self._latest_progress
+            if progress is None or hidden:
+                return
+            self._latest_progress = None
+        self.update_flash_progress(progress)
+    
+    def _on_slot_toggled(self, file_type: str, checked: bool) -> None:
+        """Atualiza a lista de slots marcados, na ordem das linhas"""
+        self._active_files = tuple(ft for ft, cb in self.checkboxes.items() if cb.isChecked())
+    
+    def browse_file(self, file_type, *_):
+        """Abre diálogo para selecionar arquivo"""
+        # *_ recebe o "checked" de clicked(bool): compilado com Cython, o slot
+        # não permite que o PyQt descarte argumentos extras
+        filename, _ = QFileDialog.getOpenFileName(
+            self,
+            f"Selecionar arquivo {file_type}",
+            self._last_dir,
+            _FW_FILTER
+        )
+        
+        if filename:
+            # Os arquivos de um firmware costumam ficar na mesma pasta
+            self._last_dir = os.path.dirname(filename)
+            self.files[file_type].setText(filename)
+            self.checkboxes[file_type].setChecked(True)
+            self.log(f"📁 Selecionado {file_type}: {os.path.basename(filename)}")
+            
+            # Animação de confirmação
+            self.animate_file_selection(file_type)
+            
+            # Pacotes TAR têm o conteúdo listado em segundo plano
+            if filename.endswith(('.tar', '.tar.md5')):
+                self.list_tar_contents(file_type, filename)
+    
+    def list_tar_contents(self, file_type, file_path):
+        """Lista as partições de um pacote TAR no log, sem bloquear a interface"""
+        runnable = TarListingRunnable(file_type, file_path)
+        runnable.signals.entry_found.connect(self._on_tar_entry)
+        runnable.signals.listing_failed.connect(self._on_tar_listing_failed)
+        # Mantém os sinais vivos até as entradas enfileiradas serem entregues
+        self._tar_listing = runnable
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_tar_entry(self, file_type, member_name, partition_name, size):
+        """Registra uma entrada do pacote TAR"""
+        self.log(f"   📄 {file_type}: {member_name} → {partition_name} ({size / (1024 * 1024):.1f} MB)")
+    
+    def _on_tar_listing_failed(self, file_type, error):
+        """Registra a falha na leitura do pacote TAR"""
+        self.log(f"⚠️ Não foi possível listar o conteúdo de {file_type}: {error}")
+    
+    def animate_file_selection(self, file_type):
+        """Anima a seleção de arquivo"""
+        file_edit = self.files[file_type]
+        
+        # Animação de destaque (regra [highlight="true"] de _FILE_ROW_QSS)
+        self._set_highlight(file_edit, True)
+        
+        # Volta ao normal após 1 segundo
+        QTimer.singleShot(1000, lambda: self._set_highlight(file_edit, False))
+    
+    @staticmethod
+    def _set_highlight(widget, highlighted):
+        """Ativa/desativa o destaque do campo e reaplica o estilo"""
+        widget.setProperty("highlight", highlighted)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+    
+    def show_file_info(self, file_type, *_):
+        """Mostra informações do arquivo"""
+        file_path = self.files[file_type].text()
+        if not file_path:
+            QMessageBox.warning(self, "Aviso", f"Nenhum arquivo {file_type} selecionado!")
+            return
+        
+        if self._info_runnable is not None:
+            return
+        
+        verify = self._verify_cached if self.verify_files_cb.isChecked() else None
+        runnable = FileInfoRunnable(verify, file_type, file_path)
+        runnable.signals.info_ready.connect(self._on_file_info_ready)
+        runnable.signals.info_failed.connect(self._on_file_info_failed)
+        
+        # O stat (lento em montagens de rede) e o hash rodam no pool de threads; o
+        # progresso só aparece se a resposta demorar (resultados em cache voltam antes)
+        self._info_progress = QProgressDialog(f"⏳ Verificando {os.path.basename(file_path)}...",
+                                              None, 0, 0, self)
+        self._info_progress.setWindowTitle(f"Informações - {file_type}")
+        self._info_progress.setMinimumDuration(300)
+        self._info_progress.setValue(0)
+        self._info_runnable = runnable
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _finish_file_info(self):
+        """Fecha o progresso da verificação de informações do arquivo"""
+        self._info_runnable = None
+        if self._info_progress is not None:
+            self._info_progress.close()
+            self._info_progress.deleteLater()
+            self._info_progress = None
+    
+    def _on_file_info_ready(self, title: str, info_text: str) -> None:
+        """Exibe as informações do arquivo quando a verificação termina"""
+        self._finish_file_info()
+        self._save_integrity_cache()
+        QMessageBox.information(self, title, info_text)
+    
+    def _on_file_info_failed(self, error: str) -> None:
+        """Exibe erro ocorrido durante a verificação do arquivo"""
+        self._finish_file_info()
+        QMessageBox.critical(self, "Erro", f"Erro ao obter informações: {error}")
+    
+    @pyqtSlot()
+    def verify_files(self):
+        """Verifica integridade dos arquivos selecionados"""
+        if self._verify_runnable is not None:
+            return
+        
+        selected_files = [(ft, self.files[ft].text()) for ft in self._active_files
+                          if self.files[ft].text()]
+        
+        if not selected_files:
+            QMessageBox.warning(self, "Aviso", "Nenhum arquivo selecionado!")
+            return
+        
+        self.log("🔍 Iniciando verificação de integridade...")
+        
+        self.verify_button.setEnabled(False)
+        self._verify_runnable = VerifyRunnable(self._verify_one, selected_files,
+                                               self.fail_fast_cb.isChecked())
+        self._verify_runnable.signals.verification_done.connect(self._on_verification_done)
+        QThreadPool.globalInstance().start(self._verify_runnable)
+    
+    def _on_verification_done(self, all_valid: bool) -> None:
+        """Mostra o resultado da verificação de integridade"""
+        self._verify_runnable = None
+        self.verify_button.setEnabled(True)
+        self._save_integrity_cache()
+        
+        if all_valid:
+            self.log("✅ Todos os arquivos são válidos!")
+            QMessageBox.information(self, "Verificação", "✅ Todos os arquivos são válidos!")
+        else:
+            self.log("⚠️ Alguns arquivos falharam na verificação")
+            QMessageBox.warning(self, "Verificação", "⚠️ Alguns arquivos falharam na verificação")
+    
+    def _verify_one(self, file_type: str, file_path: str) -> bool:
+        """Verifica um arquivo e registra o resultado no log"""
+        try:
+            if self._verify_cached(file_path):
+                self.log(f"✅ {file_type}: Arquivo válido")
+                return True
+            self.log(f"❌ {file_type}: Falha na verificação")
+        except Exception as e:
+            self.log(f"❌ {file_type}: Erro - {str(e)}")
+        return False
+    
+    @pyqtSlot()
+    def reset_form(self):
+        """Limpa o formulário com animação"""
+        # Animação de limpeza
+        for file_edit in self.files.values():
+            file_edit.clear()
+        
+        for checkbox in self.checkboxes.values():
+            checkbox.setChecked(False)
+        
+        self.progress_bar.setVisible(False)
+        self.progress_details.setVisible(False)
+        
+        self.log("🧹 Formulário limpo")
+    
+    @pyqtSlot()
+    def start_flash(self):
+        """Inicia o processo de flash"""
+        # Coleta arquivos selecionados
+        selected_files = {ft: self.files[ft].text() for ft in self._active_files
+                          if self.files[ft].text()}
+        
+        if not selected_files:
+            QMessageBox.warning(self, "Aviso", "Selecione pelo menos um arquivo!")
+            return
+        
+        if not self.current_device:
+            QMessageBox.warning(self, "Aviso", "Nenhum dispositivo conectado!")
+            return
+        
+        # Confirmação com design moderno
+        names = {ft: os.path.basename(fp) for ft, fp in selected_files.items()}
+        file_list = "".join(f"• <b>{ft}:</b> {name}<br>" for ft, name in names.items())
+        
+        reply = QMessageBox.question(
+            self, 
+            "🚀 Confirmar Flash",
+            _CONFIRM_HTML.format_map({
+                'device': self.current_device.model or 'Samsung Device',
+                'files': file_list
+            }),
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        # Inicia flash
+        self.log("📦 Arquivos: " + ", ".join(f"{ft}={name}" for ft, name in names.items()))
+        self.is_flashing = True
+        self.start_button.setEnabled(False)
+        self.start_button.setText("🔥 Fazendo Flash...")
+        self.progress_bar.setVisible(True)
+        self.progress_details.setVisible(True)
+        self.progress_bar.setValue(0)
+        self._last_pct = 0
+        self._last_details = None
+        
+        options = {
+            'auto_reboot': self.auto_reboot_cb.isChecked(),
+            'verify_integrity': self.verify_files_cb.isChecked(),
+            'known_integrity': self._known_integrity(selected_files.values()),
+            'backup_before_flash': self.backup_before_flash_cb.isChecked()
+        }
+        
+        self.flash_runnable = FlashRunnable(self.flash_engine, selected_files, options)
+        # Progresso e log chegam pelos callbacks da engine, que escrevem em buffers
+        # seguros entre threads; só a conclusão precisa rodar na thread da interface
+        self.flash_runnable.signals.flash_completed.connect(self.flash_completed,
+                                                           Qt.ConnectionType.QueuedConnection)
+        with self._progress_lock:
+            self._latest_progress = None
+        QThreadPool.globalInstance().start(self.flash_runnable)
+    
+    def flash_completed(self, success, message):
+        """Callback quando o flash é concluído"""
+        self._progress_timer.stop()
+        self._flush_progress()
+        self.is_flashing = False
+        self.start_button.setEnabled(True)
+        self.start_button.setText("🚀 Iniciar Flash")
+        
+        # Aproveita a verificação feita durante o envio
+        for file_path, valid in self.flash_engine.integrity_results.items():
+            try:
+                key = self._integrity_key(file_path, os.stat(file_path))
+            except OSError:
+                continue
+            with self._integrity_lock:
+                self._integrity_cache[key] = valid
+                self._integrity_cache_dirty = True
+        self._save_integrity_cache()
+        
+        if success:
+            # Animação de sucesso
+            QMessageBox.information(self, "🎉 Sucesso", f"<h2>🎉 {message}</h2><p>O flash foi concluído com sucesso!</p>")
+            self.log(f"🎉 {message}")
+            
+            # Reinicia dispositivo se solicitado
+            if self.auto_reboot_cb.isChecked():
+                self.log("🔄 Reiniciando dispositivo...")
+                self.flash_engine.reboot_device()
+        else:
+            QMessageBox.critical(self, "❌ Erro", f"<h2>❌ Erro no Flash</h2><p>{message}</p>")
+            self.log(f"❌ {message}")
+    
+    @pyqtSlot()
+    def refresh_devices(self):
+        """Atualiza lista de dispositivos"""
+        self.log("🔄 Atualizando lista de dispositivos...")
+        if self.device_thread and self.device_thread.isRunning():
+            self.device_thread.rescan()
+        # Tenta de novo a conexão caso o último handshake tenha falhado
+        self._connect_first_device()
+    
+    @pyqtSlot()
+    def clear_log(self):
+        """Limpa o log"""
+        with self._log_lock:
+            self._log_buf.clear()
+        self.log_text.clear()
+        self.log("🧹 Log limpo")
+    
+    @pyqtSlot()
+    def save_log(self):
+        """Salva o log em arquivo"""
+        filename, _ = QFileDialog.getSaveFileName(
+            self,
+            "Salvar log",
+            f"zodin_log_{time.strftime('%Y%m%d_%H%M%S')}.txt",
+            _TXT_FILTER
+        )
+        
+        if filename:
+            self._flush_log()
+            # Copia o texto bloco a bloco na thread da interface (o documento não é
+            # seguro entre threads); a codificação e a escrita ficam no worker
+            lines = []
+            block = self.log_text.document().firstBlock()
+            while block.isValid():
+                lines.append(block.text())
+                block = block.next()
+            
+            runnable = LogSaveRunnable(filename, lines)
+            runnable.signals.saved.connect(self._on_log_saved)
+            runnable.signals.save_failed.connect(self._on_log_save_failed)
+            self._log_save_runnable = runnable
+            QThreadPool.globalInstance().start(runnable)
+    
+    def _on_log_saved(self, filename: str) -> None:
+        """Registra o fim da gravação do log"""
+        self._log_save_runnable = None
+        self.log(f"💾 Log salvo: {filename}")
+    
+    def _on_log_save_failed(self, error: str) -> None:
+        """Registra a falha na gravação do log"""
+        self._log_save_runnable = None
+        self.log(f"❌ Erro ao salvar log: {error}")
+    
+    def closeEvent(self, event):
+        """Evento de fechamento da aplicação"""
+        if self.is_flashing:
+            reply = QMessageBox.question(
+                self,
+                "Flash em Andamento",
+                "⚠️ Uma operação de flash está em andamento!\n\n"
+                "Interromper pode danificar o dispositivo.\n"
+                "Deseja realmente sair?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            
+            if reply == QMessageBox.StandardButton.No:
+                event.ignore()
+                return
+        
+        # Some com a janela já; o encerramento abaixo pode esperar pelo USB
+        self.hide()
+        
+        if self.device_thread:
+            self.device_thread.stop()
+            if not self.device_thread.wait(1000):
+                # Presa numa chamada da libusb: a thread é interrompida à força
+                self.device_thread.terminate()
+                self.device_thread.wait(500)
+        
+        # Desconecta dispositivo no pool; a espera abaixo limita o tempo gasto
+        if self.flash_engine:
+            QThreadPool.globalInstance().start(self.flash_engine.disconnect)
+        
+        # Aguarda as tarefas do pool terminarem
+        QThreadPool.globalInstance().waitForDone(5000)
+        
+        self.log("👋 Encerrando Zodin Flash Tool...")
+        self._log_timer.stop()
+        self._flush_log()
+        event.accept()